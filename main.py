@@ -24,15 +24,19 @@ def main():
         return 1
 
     from PyQt5.QtWidgets import QApplication
-    from ui.main_window import MainWindow
     from ui.init_wizard import InitWizard
 
     app = QApplication(sys.argv)
+    from ui.styles import APP_QSS
+    app.setStyleSheet(APP_QSS)
     # Show initialization wizard first
     init = InitWizard()
     if init.exec_() != init.Accepted:
         solvision_manager.dispose()
         return 0
+    # Imported only once the wizard is accepted: the main window module pulls in the tabs,
+    # panels and remaining hardware services, none of which the wizard needs.
+    from ui.main_window import MainWindow
     window = MainWindow()
     window.show()
     rc = app.exec_()
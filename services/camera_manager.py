@@ -68,11 +68,13 @@ def _apply_light(role: str) -> bool:
         return False
 
 
-def capture(role: str, *, save_path: Optional[str] = None):
+def capture(role: str, *, save_path: Optional[str] = None, latest: bool = False):
     """Capture a frame from the specified role ('Top' or 'Front').
     Steps:
       1) Apply light (CH1 only) for the role (verified internally by controller).
-      2) Flush a couple frames from the backend queue (best-effort).
+      2) Flush a couple frames from the backend queue (best-effort), or drain
+         the whole queue when ``latest`` is set (plus the deep flush after a
+         light or role change).
       3) Capture from the underlying camera_service.
       4) Optionally save to disk.
     """
@@ -95,7 +97,14 @@ def capture(role: str, *, save_path: Optional[str] = None):
 
             global _last_role
             deep = changed or (_last_role is not None and _last_role != role)
-            _svc.flush(role, frames=(4 if deep else 2), timeout_ms=(80 if deep else 50))
+            if latest:
+                _svc.drain(role)
+                # Frames exposed while the light settled or before the role switch can still
+                # arrive after the queue is empty; keep the deep flush for those cases.
+                if deep:
+                    _svc.flush(role, frames=4, timeout_ms=80)
+            else:
+                _svc.flush(role, frames=(4 if deep else 2), timeout_ms=(80 if deep else 50))
             _last_role = role
         except Exception:
             pass
@@ -115,6 +124,12 @@ def capture(role: str, *, save_path: Optional[str] = None):
     return frame
 
 
+def capture_latest(role: str, *, save_path: Optional[str] = None):
+    """Capture the newest frame after motion: drains every queued frame first so
+    the result reflects the current pose rather than a stale buffered one."""
+    return capture(role, save_path=save_path, latest=True)
+
+
 def capture_live(role: str, *, timeout_ms: int = 100, flush_frames: int = 0):
     """Low-latency capture intended for live UI preview.
 
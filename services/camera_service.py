@@ -11,6 +11,7 @@ camera_service so downstream callers (UI + camera_manager) keep working:
 - get_connected_index(role:str) -> Optional[int]  # returns global index
 - capture(role:str) -> numpy.ndarray (BGR, uint8)
 - flush(role:str, frames:int=2, timeout_ms:int=50) -> None
+- drain(role:str, max_frames:int=16, timeout_ms:int=5) -> int
 - release_all() -> None
 - backend_name() -> str
 - diagnostics() -> dict
@@ -927,6 +928,34 @@ def flush(role: str, frames: int = 2, timeout_ms: int = 50) -> None:
                 break
 
 
+def drain(role: str, max_frames: int = 16, timeout_ms: int = 5) -> int:
+    """Discard every frame already queued for the role; returns how many were dropped.
+
+    Unlike flush(), which drops a fixed count, this keeps fetching with a short
+    timeout until the queue is empty so the next capture() sees a fresh frame.
+    """
+    role = _normalize_role(role)
+    with _LOCK:
+        ctx = _ROLE_CONN.get(role)
+        if ctx is None:
+            return 0
+
+    dropped = 0
+    with ctx.lock:
+        ia = ctx.ia
+        if ia is None:
+            return 0
+        timeout_s = _ms_to_s(timeout_ms)
+        for _ in range(max(0, int(max_frames))):
+            try:
+                with ia.fetch(timeout=timeout_s) as _buffer:
+                    pass
+            except Exception:
+                break
+            dropped += 1
+    return dropped
+
+
 def release_all() -> None:
     global _HARVESTER
     with _LOCK:
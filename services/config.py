@@ -52,6 +52,12 @@ class AppState:
     solvision_nms_threshold: Optional[float] = None
     solvision_max_detections: Optional[int] = None
     defect_score_threshold: Optional[float] = None
+    # Step-4 bbox PNG decode reduction for the defect model input: 0 = full size, 1/2/3 = 1/2, 1/4, 1/8 scale.
+    # The full-size decode for the step-04 annotation only happens when one is written.
+    # Only worth enabling when the defect model would downscale the crops anyway.
+    defect_decode_reduce: Optional[int] = None
+    # Write the annotated "No detection"/"No defects" PNGs for empty Step-3/4 results
+    emit_empty_annotations: Optional[bool] = None
     # Persisted contour/edge tuning parameters for arrow computation
     contour_params: Optional[dict] = None
     # Step-2 square crop size (pixels)
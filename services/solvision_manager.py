@@ -7,11 +7,13 @@ detect, detect_for, etc.) without any SolVision/.NET dependencies.
 
 import os
 import json
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import cv2
+import numpy as np
 import torch
 from detectron2.config import get_cfg
 from detectron2.engine import DefaultPredictor
@@ -21,6 +23,8 @@ from .config import state as _state
 
 _predictors: Dict[str, DefaultPredictor] = {}  # e.g., {"top": pred, "front": pred2}
 _model_paths: Dict[str, str] = {}
+# One inference at a time per model; callers may run detect_for from worker pools
+_predict_locks: Dict[str, threading.Lock] = {}
 _initialized_error: Optional[str] = None
 _log_cb: Optional[Callable[[str], None]] = None
 
@@ -291,6 +295,9 @@ def _normalize_detections(
     scores = instances.scores if instances.has("scores") else None
     classes = instances.pred_classes if instances.has("pred_classes") else None
     masks = instances.pred_masks if instances.has("pred_masks") else None
+    if masks is not None:
+        # One tensor->ndarray conversion for all instances instead of one per detection
+        masks = masks.numpy()
 
     num = len(instances)
     for i in range(num):
@@ -321,11 +328,11 @@ def _normalize_detections(
             and 0 <= cls_id < len(class_colors)
         ):
             color_hex = class_colors[cls_id]
-        mask = masks[i].numpy() if masks is not None else None
+        mask = masks[i] if masks is not None else None
         area = float(w * h) if w is not None and h is not None else None
         if mask is not None:
             try:
-                area = float(mask.sum())
+                area = float(np.count_nonzero(mask))
             except Exception:
                 pass
         results.append(
@@ -353,9 +360,7 @@ def detect_inproc(image_path: str, score_threshold: Optional[float] = None) -> L
     return detect(image_path, score_threshold=score_threshold)
 
 
-def detect_for(name: str, image_path: str, score_threshold: Optional[float] = None) -> List[Dict[str, Any]]:
-    if not image_path:
-        raise ValueError("Empty image path")
+def _run_params(name: str, score_threshold: Optional[float]):
     if name not in _predictors:
         raise RuntimeError(f"Model '{name}' not loaded")
     meta = _model_meta.get(name)
@@ -378,19 +383,33 @@ def detect_for(name: str, image_path: str, score_threshold: Optional[float] = No
     if thr is None:
         thr = 0.0
 
-    img = cv2.imread(image_path)
-    if img is None:
-        raise RuntimeError(f"Failed to read image: {image_path}")
-
-    predictor = _predictors[name]
     class_names = (
         meta.class_names if meta is not None else _class_names_per_model.get(name, CLASS_NAMES)
     )
     per_class_thresholds = (
         meta.class_thresholds if (meta is not None and score_threshold is None and state_thr is None) else None
     )
-    class_colors = class_colors_for(name)
-    outputs = predictor(img)
+    return thr, class_names, class_colors_for(name), per_class_thresholds
+
+
+def detect_for(
+    name: str,
+    image_path: Union[str, np.ndarray],
+    score_threshold: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Run the named model on an image file path or an already-decoded BGR ndarray."""
+    is_array = isinstance(image_path, np.ndarray)
+    if not is_array and not image_path:
+        raise ValueError("Empty image path")
+    thr, class_names, class_colors, per_class_thresholds = _run_params(name, score_threshold)
+
+    img = image_path if is_array else cv2.imread(image_path)
+    if img is None:
+        raise RuntimeError(f"Failed to read image: {image_path}")
+
+    predictor = _predictors[name]
+    with _predict_locks.setdefault(name, threading.Lock()):
+        outputs = predictor(img)
     instances = outputs.get("instances", None)
     if instances is not None:
         instances = instances.to("cpu")
@@ -398,6 +417,42 @@ def detect_for(name: str, image_path: str, score_threshold: Optional[float] = No
     return _normalize_detections(instances, thr, class_names, class_colors, per_class_thresholds)
 
 
+def detect_batch_for(
+    name: str,
+    images: List[Union[str, np.ndarray]],
+    score_threshold: Optional[float] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Run the named model on several images in one forward pass; results follow input order."""
+    if not images:
+        return []
+    thr, class_names, class_colors, per_class_thresholds = _run_params(name, score_threshold)
+
+    predictor = _predictors[name]
+    inputs = []
+    with torch.no_grad():
+        # Same preprocessing as DefaultPredictor.__call__, applied per image
+        for item in images:
+            img = item if isinstance(item, np.ndarray) else cv2.imread(str(item))
+            if img is None:
+                raise RuntimeError(f"Failed to read image: {item}")
+            if predictor.input_format == "RGB":
+                img = img[:, :, ::-1]
+            height, width = img.shape[:2]
+            tensor = predictor.aug.get_transform(img).apply_image(img)
+            tensor = torch.as_tensor(tensor.astype("float32").transpose(2, 0, 1))
+            inputs.append({"image": tensor, "height": height, "width": width})
+        with _predict_locks.setdefault(name, threading.Lock()):
+            outputs = predictor.model(inputs)
+
+    results = []
+    for out in outputs:
+        instances = out.get("instances", None)
+        if instances is not None:
+            instances = instances.to("cpu")
+        results.append(_normalize_detections(instances, thr, class_names, class_colors, per_class_thresholds))
+    return results
+
+
 def dispose():
     """Release predictors (best effort)."""
     _predictors.clear()
@@ -1,5 +1,5 @@
 from typing import List, Dict, Optional
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, QSignalBlocker
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,6 +10,8 @@ from PyQt5.QtWidgets import (
     QPushButton,
 )
 
+from .styles import set_button_state
+
 
 class _RoleWidget(QWidget):
     selection_changed = pyqtSignal(str, int)
@@ -58,17 +60,19 @@ class _RoleWidget(QWidget):
 
     def set_devices(self, devices: List[Dict]):
         current = self.selector.currentData()
-        self.selector.blockSignals(True)
-        self.selector.clear()
-        for d in devices:
-            self.selector.addItem(d.get("name", f"Camera {d.get('index','?')}") , d)
-        # Try to restore selection
-        if current is not None:
-            for i in range(self.selector.count()):
-                if self.selector.itemData(i) == current:
-                    self.selector.setCurrentIndex(i)
-                    break
-        self.selector.blockSignals(False)
+        blocker = QSignalBlocker(self.selector)
+        try:
+            self.selector.clear()
+            for d in devices:
+                self.selector.addItem(d.get("name", f"Camera {d.get('index','?')}") , d)
+            # Try to restore selection
+            if current is not None:
+                for i in range(self.selector.count()):
+                    if self.selector.itemData(i) == current:
+                        self.selector.setCurrentIndex(i)
+                        break
+        finally:
+            blocker.unblock()
         self._refresh_detail()
 
     def selected_device_index(self) -> Optional[int]:
@@ -110,29 +114,20 @@ class _RoleWidget(QWidget):
                 )
 
     def _apply_connect_style(self, connected: bool):
-        if connected:
-            self.bt_connect.setStyleSheet(
-                "QPushButton {"
-                " background-color: #2e7d32; color: white;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: #388e3c; }"
-            )
-        else:
-            self.bt_connect.setStyleSheet(
-                "QPushButton {"
-                " background: transparent; color: #2e7d32;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: rgba(46,125,50,0.08); }"
-            )
+        set_button_state(self.bt_connect, "active" if connected else "idle")
 
     # Programmatic selection helper
     def select_device_index(self, index: int):
+        # Programmatic restore: no selection_changed, so the saved index is not written back
         for i in range(self.selector.count()):
             data = self.selector.itemData(i)
             if isinstance(data, dict) and int(data.get("index", -1)) == int(index):
-                self.selector.setCurrentIndex(i)
+                blocker = QSignalBlocker(self.selector)
+                try:
+                    self.selector.setCurrentIndex(i)
+                finally:
+                    blocker.unblock()
+                self._refresh_detail()
                 break
 
     def set_stream_status(self, text: str):
@@ -1,5 +1,4 @@
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPixmap, QImage
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QComboBox, QSpinBox, QDoubleSpinBox, QGroupBox, QFormLayout, QFileDialog,
@@ -11,6 +10,7 @@ import numpy as np
 
 from services import contour_tools as ct
 from services import camera_manager as cammgr
+from ui.qt_image import np_bgr_to_qpixmap
 
 
 class EdgeTunerDialog(QDialog):
@@ -235,7 +235,6 @@ class EdgeTunerDialog(QDialog):
                 src = self._get_best_image()
                 if src is not None:
                     try:
-                        from ui.qt_image import np_bgr_to_qpixmap
                         parent.preview_panel.set_original_np(np_bgr_to_qpixmap(src))
                     except Exception:
                         pass
@@ -251,10 +250,10 @@ class EdgeTunerDialog(QDialog):
 
     def _set_preview(self, bgr):
         try:
-            rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-            h, w = rgb.shape[:2]
-            qi = QImage(rgb.data, w, h, rgb.strides[0], QImage.Format_RGB888).copy()
-            pm = QPixmap.fromImage(qi)
+            # Wraps the BGR buffer as Format_BGR888 where available; no BGR->RGB copy
+            pm = np_bgr_to_qpixmap(bgr)
+            if pm is None:
+                raise ValueError("unsupported image")
             wlbl = max(1, self._preview.width())
             hlbl = max(1, self._preview.height())
             self._preview.setPixmap(pm.scaled(wlbl, hlbl, Qt.KeepAspectRatio, transformMode=Qt.FastTransformation))
@@ -50,6 +50,9 @@ class ImagePreviewPanel(QWidget):
         # Keep base pixmaps (pre-overlay) for high-quality rescaling on resize
         self._original_base_pm = None
         self._front_base_pm = None
+        # (w, h) of the frame a downscaled base pixmap came from; overlays are in those coords
+        self._original_src_size = None
+        self._front_src_size = None
         self._front_overlay_enabled = True
         self._attachment_detections = []  # list of dicts: 'bounds','class','score', optional 'arrow'
         self._attachment_contour = None   # list of (x,y) points in original coords
@@ -58,6 +61,16 @@ class ImagePreviewPanel(QWidget):
         self._draw_boxes = True
 
     # Public helpers
+    def preview_target_size(self, role: str):
+        label = self.original_label if role == "Top" else self.front_label
+        return max(1, label.width()), max(1, label.height())
+
+    @staticmethod
+    def _overlay_dims(base: QPixmap, src_size):
+        if src_size:
+            return src_size
+        return base.width(), base.height()
+
     def _apply_scaled_cover(self, label: QLabel, pm: QPixmap):
         if pm is None or pm.isNull():
             label.setText("Failed to load image.")
@@ -88,7 +101,8 @@ class ImagePreviewPanel(QWidget):
             composed = self._scale_and_crop(base, target_w, target_h)
             # Apply overlay if we have detections or a tuned contour
             if self._attachment_detections or (self._attachment_contour is not None):
-                composed = self._apply_attachment_overlay(base, composed, target_w, target_h)
+                composed = self._apply_attachment_overlay(base, composed, target_w, target_h,
+                                                          self._original_src_size)
             self.original_label.setPixmap(composed)
 
     def _render_front(self):
@@ -100,10 +114,11 @@ class ImagePreviewPanel(QWidget):
         base = self._front_base_pm
         composed = self._scale_and_crop(base, w, h)
         if self._front_overlay_enabled:
-            composed = self._apply_front_overlay(base, composed, w, h)
+            composed = self._apply_front_overlay(base, composed, w, h, self._front_src_size)
         self.front_label.setPixmap(composed)
 
-    def _apply_front_overlay(self, base: QPixmap, composed: QPixmap, target_w: int, target_h: int) -> QPixmap:
+    def _apply_front_overlay(self, base: QPixmap, composed: QPixmap, target_w: int, target_h: int,
+                             src_size=None) -> QPixmap:
         # Draw red center crosshair and optional detection boxes on the composed pixmap
         if composed is None or composed.isNull():
             return composed
@@ -111,7 +126,7 @@ class ImagePreviewPanel(QWidget):
         painter = QPainter(result)
         painter.setRenderHint(QPainter.Antialiasing, True)
         # Compute mapping like in _apply_attachment_overlay
-        bw, bh = base.width(), base.height()
+        bw, bh = self._overlay_dims(base, src_size)
         if bw <= 0 or bh <= 0:
             return result
         sx = target_w / bw
@@ -180,7 +195,7 @@ class ImagePreviewPanel(QWidget):
             painter = QPainter(result)
             painter.setRenderHint(QPainter.Antialiasing, True)
             # same mapping s/off_x/off_y computed above
-            bw, bh = base.width(), base.height()
+            bw, bh = self._overlay_dims(base, src_size)
             sx = target_w / bw; sy = target_h / bh; s = max(sx, sy)
             scaled_w = int(bw * s); scaled_h = int(bh * s)
             off_x = max(0, (scaled_w - target_w) // 2)
@@ -199,7 +214,8 @@ class ImagePreviewPanel(QWidget):
             painter.end()
         return result
 
-    def _apply_attachment_overlay(self, base: QPixmap, composed: QPixmap, target_w: int, target_h: int) -> QPixmap:
+    def _apply_attachment_overlay(self, base: QPixmap, composed: QPixmap, target_w: int, target_h: int,
+                                  src_size=None) -> QPixmap:
         # Draw detection markers (filled circles) on the already scaled+cropped image.
         if composed is None or composed.isNull():
             return composed
@@ -207,8 +223,8 @@ class ImagePreviewPanel(QWidget):
         from PyQt5.QtGui import QFont, QBrush
         painter = QPainter(result)
         painter.setRenderHint(QPainter.Antialiasing, True)
-        # Compute scale and crop offsets used by _scale_and_crop
-        bw, bh = base.width(), base.height()
+        # Compute scale and crop offsets used by _scale_and_crop (in source-frame coords)
+        bw, bh = self._overlay_dims(base, src_size)
         if bw <= 0 or bh <= 0:
             return result
         sx = target_w / bw
@@ -308,19 +324,23 @@ class ImagePreviewPanel(QWidget):
 
     def set_original_image(self, path: str):
         self._original_base_pm = QPixmap(path)
+        self._original_src_size = None
         self._render_original()
 
     def set_front_preview_image(self, path: str):
         self._front_base_pm = QPixmap(path)
+        self._front_src_size = None
         self._render_front()
 
-    # New helpers for numpy images
-    def set_original_np(self, pixmap: QPixmap):
+    # New helpers for numpy images; source_size is the full frame (w, h) when pixmap was downscaled
+    def set_original_np(self, pixmap: QPixmap, source_size=None):
         self._original_base_pm = pixmap
+        self._original_src_size = source_size
         self._render_original()
 
-    def set_front_np(self, pixmap: QPixmap):
+    def set_front_np(self, pixmap: QPixmap, source_size=None):
         self._front_base_pm = pixmap
+        self._front_src_size = source_size
         self._render_front()
 
     def set_overlay_enabled(self, enabled: bool):
@@ -365,7 +385,8 @@ class ImagePreviewPanel(QWidget):
         base = self._original_base_pm
         composed = self._scale_and_crop(base, target_w, target_h)
         if self._attachment_detections or (self._attachment_contour is not None):
-            composed = self._apply_attachment_overlay(base, composed, target_w, target_h)
+            composed = self._apply_attachment_overlay(base, composed, target_w, target_h,
+                                                      self._original_src_size)
         return composed
 
     def capture_attachment_view_fullres(self):
@@ -375,7 +396,8 @@ class ImagePreviewPanel(QWidget):
         base = self._original_base_pm
         composed = QPixmap(base)
         if self._attachment_detections or (self._attachment_contour is not None):
-            composed = self._apply_attachment_overlay(base, composed, base.width(), base.height())
+            composed = self._apply_attachment_overlay(base, composed, base.width(), base.height(),
+                                                      self._original_src_size)
         return composed
 
     def save_attachment_view(self, path: str) -> bool:
@@ -407,7 +429,7 @@ class ImagePreviewPanel(QWidget):
         base = self._front_base_pm
         composed = self._scale_and_crop(base, target_w, target_h)
         if self._front_overlay_enabled:
-            composed = self._apply_front_overlay(base, composed, target_w, target_h)
+            composed = self._apply_front_overlay(base, composed, target_w, target_h, self._front_src_size)
         return composed
 
     def render_attachment_overlay(self, base_pixmap: QPixmap, detections, contour=None):
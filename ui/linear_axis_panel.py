@@ -1,6 +1,6 @@
 from typing import Optional
 
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, QSignalBlocker
 from PyQt5.QtWidgets import (
     QWidget,
     QGroupBox,
@@ -13,6 +13,9 @@ from PyQt5.QtWidgets import (
     QSpinBox,
 )
 
+from .port_connect import PortConnectMixin
+from .styles import set_button_state
+
 _ACT_STATE_NAMES = {
     10: "UNCAL",
     20: "IDLE",
@@ -32,7 +35,7 @@ _ACT_FAULT_NAMES = {
 }
 
 
-class LinearAxisPanel(QWidget):
+class LinearAxisPanel(PortConnectMixin, QWidget):
     refresh_requested = pyqtSignal()
     connect_requested = pyqtSignal(str)
     calibrate_requested = pyqtSignal()
@@ -43,6 +46,7 @@ class LinearAxisPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._port_index = {}
         group = QGroupBox("Linear Axis (Front Camera)")
         root = QVBoxLayout(self)
         root.addWidget(group)
@@ -53,7 +57,7 @@ class LinearAxisPanel(QWidget):
         row = QHBoxLayout()
         self.port_combo = QComboBox()
         self.port_combo.setEditable(True)
-        self.port_combo.currentTextChanged.connect(lambda s: self.port_selected.emit(s))
+        self.port_combo.currentTextChanged.connect(self.port_selected)
         row.addWidget(self.port_combo, stretch=1)
 
         self.bt_refresh = QPushButton("Refresh")
@@ -138,6 +142,7 @@ class LinearAxisPanel(QWidget):
         v.addWidget(self.status)
 
         self._connected = False
+        self._connected_port = None
         self._calibrated = False
         self._ready = False
         self._calibrating = False
@@ -145,11 +150,6 @@ class LinearAxisPanel(QWidget):
         self._live_position_steps: Optional[int] = None
         self._update_enabled()
 
-    def _on_connect(self):
-        port = self.port_combo.currentText().strip()
-        if port:
-            self.connect_requested.emit(port)
-
     def _on_home(self):
         self.home_requested.emit(int(self._home_steps))
 
@@ -170,14 +170,35 @@ class LinearAxisPanel(QWidget):
             self.set_status(f"Calibrated. Live position: {int(self._live_position_steps or 0)} steps.")
 
     def set_ports(self, ports):
-        self.port_combo.blockSignals(True)
-        self.port_combo.clear()
-        for p in ports:
-            self.port_combo.addItem(p)
-        self.port_combo.blockSignals(False)
+        blocker = QSignalBlocker(self.port_combo)
+        try:
+            self.port_combo.clear()
+            names = [str(p) for p in ports]
+            self.port_combo.addItems(names)
+            self._port_index = {}
+            for i, name in enumerate(names):
+                self._port_index.setdefault(name, i)
+        finally:
+            blocker.unblock()
+
+    def select_host(self, host: str) -> bool:
+        # Programmatic restore: no port_selected, so the saved host is not written back
+        idx = self._port_index.get(host)
+        if idx is None:
+            # Typed-in entries are not in the map
+            idx = self.port_combo.findText(host)
+        if idx < 0:
+            return False
+        blocker = QSignalBlocker(self.port_combo)
+        try:
+            self.port_combo.setCurrentIndex(idx)
+        finally:
+            blocker.unblock()
+        return True
 
     def set_connected(self, connected: bool, port: Optional[str] = None):
         self._connected = connected
+        self._track_connected_port(connected, port)
         if not connected:
             self._ready = False
             self._calibrated = False
@@ -294,47 +315,14 @@ class LinearAxisPanel(QWidget):
 
         # Calibrate button color: red while calibrating, green when calibrated, default otherwise
         if self._calibrating:
-            self.bt_calibrate.setStyleSheet(
-                "QPushButton {"
-                " background-color: #c62828; color: white;"
-                " border: 2px solid #c62828; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: #d32f2f; }"
-            )
+            set_button_state(self.bt_calibrate, "busy")
         elif self._calibrated:
-            self.bt_calibrate.setStyleSheet(
-                "QPushButton {"
-                " background-color: #2e7d32; color: white;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: #388e3c; }"
-            )
+            set_button_state(self.bt_calibrate, "active")
         else:
-            self.bt_calibrate.setStyleSheet(
-                "QPushButton {"
-                " background: transparent; color: #2e7d32;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: rgba(46,125,50,0.08); }"
-            )
+            set_button_state(self.bt_calibrate, "idle")
 
     def _apply_connect_style(self, connected: bool):
-        if connected:
-            self.bt_connect.setStyleSheet(
-                "QPushButton {"
-                " background-color: #2e7d32; color: white;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: #388e3c; }"
-            )
-        else:
-            self.bt_connect.setStyleSheet(
-                "QPushButton {"
-                " background: transparent; color: #2e7d32;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: rgba(46,125,50,0.08); }"
-            )
+        set_button_state(self.bt_connect, "active" if connected else "idle")
 
     def _update_home_button_text(self, steps: int):
         try:
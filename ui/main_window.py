@@ -1,4 +1,4 @@
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer, QSignalBlocker
 from PyQt5.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -14,7 +14,7 @@ from .workflow_tab import WorkflowTab
 from .logic_tab import LogicTab
 from .image_preview_panel import ImagePreviewPanel
 from .defect_ledger import DefectLedger
-from .qt_image import np_bgr_to_qpixmap
+from .qt_image import np_bgr_to_qimage, np_bgr_to_qpixmap
 from services import project_loader
 from services import camera_service
 from services import camera_manager as cammgr
@@ -25,15 +25,352 @@ from services.config import settings, state, save_state
 from services import solvision_manager
 from services.app_paths import app_root
 import concurrent.futures
+import hashlib
+import math
+from functools import lru_cache
 import os
+import re
+import threading
 import time
+from pathlib import Path
 import cv2
+import numpy as np
 
 # Horizontal FOV of the front camera when measured inside the top-camera image (pixels)
 DEFAULT_FRONT_FOV_TOP_PX = 441.4
 # Front-view calibration: 1450 actuator steps corresponds to 1270 px in the front image.
 FRONT_STEPS_PER_PIXEL = 1450.0 / 1270.0
 FRONT_IMAGE_WIDTH_PX = 2464.0
+# Inspection-only Step 2 snapshots: fast PNG level (still lossless) instead of the default 3,
+# with RLE strategy since the frames are dominated by uniform background
+_DEBUG_IMG_PARAMS = [
+    int(cv2.IMWRITE_PNG_COMPRESSION), 1,
+    int(cv2.IMWRITE_PNG_STRATEGY), int(cv2.IMWRITE_PNG_STRATEGY_RLE),
+]
+# Step 3/4 outputs keep .png (Step 4 reads the Step 3 bbox crops back) but use fast level 1
+_STEP_IMG_PARAMS = [int(cv2.IMWRITE_PNG_COMPRESSION), 1]
+# Characters replaced with '_' in part IDs and labels used in file/folder names
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+# AppState.defect_decode_reduce -> libpng/libjpeg scaled decode of the Step 4 model input (0 = full size)
+_DECODE_REDUCE_FLAGS = {
+    1: cv2.IMREAD_REDUCED_COLOR_2,
+    2: cv2.IMREAD_REDUCED_COLOR_4,
+    3: cv2.IMREAD_REDUCED_COLOR_8,
+}
+# Numeric scalar types seen in detection dicts (Python or NumPy); checked instead of try/int()
+_REAL_TYPES = (int, float, np.integer, np.floating)
+
+
+def _decode_reduce_flag(decode_reduce):
+    try:
+        return _DECODE_REDUCE_FLAGS.get(int(decode_reduce or 0))
+    except (TypeError, ValueError):
+        return None
+
+
+def _read_defect_input(src, decode_reduce):
+    """Defect model input for a Step 4 bbox crop (ndarray or PNG path); None if unreadable.
+
+    PNG paths are decoded at the reduced size; arrays have no decode to cut and are used as is.
+    """
+    if isinstance(src, np.ndarray):
+        return src
+    flag = _decode_reduce_flag(decode_reduce)
+    return cv2.imread(str(src)) if flag is None else cv2.imread(str(src), flag)
+
+
+def _full_size_crop(src, model_img, decode_reduce):
+    """Full-size crop to annotate; the PNG is decoded again only if model_img was reduced.
+
+    Arrays are returned as is, so callers copy them when the buffer is shared.
+    """
+    if isinstance(src, np.ndarray):
+        return src
+    if _decode_reduce_flag(decode_reduce) is None:
+        return model_img
+    return cv2.imread(str(src))
+
+
+def _scale_detections(dets, sx, sy):
+    """Copy of dets with 'bounds' scaled by (sx, sy); dets is returned as is at scale 1."""
+    if not dets or (sx == 1.0 and sy == 1.0):
+        return dets
+    out = []
+    for det in dets:
+        b = det.get('bounds')
+        if b and len(b) >= 4 and all(isinstance(v, _REAL_TYPES) for v in b[:4]):
+            x, y, w, h = (float(v) for v in b[:4])
+            det = dict(det, bounds=[x * sx, y * sy, w * sx, h * sy])
+        out.append(det)
+    return out
+
+
+def _remove_stale_step3(step3_dir, idx, annotation=True):
+    """Drop step-03 outputs for idx left over from an earlier run in the same folder.
+
+    The bbox crop always goes (Step 4's missing-only fallback would pick it up); the
+    annotated frame only when annotation is True, i.e. no new one is written for idx.
+    """
+    names = [f"step-03_front_bbox_{idx:03d}.png"]
+    if annotation:
+        names.append(f"step-03_front_{idx:03d}.png")
+    for name in names:
+        try:
+            os.remove(Path(step3_dir) / name)
+        except OSError:
+            pass
+
+
+# path -> (size, mtime_ns, digest) of PNGs this process wrote or verified, so unchanged
+# re-run results can be recognized from a stat instead of reading the file back
+_written_digests = {}
+_written_digests_lock = threading.Lock()
+
+
+def _imwrite_if_changed(path, img, params, skip_unchanged=False):
+    """Encode img and write it to path; returns "written", "unchanged" or "failed" (encode error).
+
+    With skip_unchanged (Step 4 re-runs over an existing run folder, which mostly
+    regenerate identical results) a file already holding the same bytes is left
+    untouched, mtime included. Files recorded in _written_digests are matched by
+    stat + digest; any other same-size file is read back once, deliberately, since
+    that costs less than rewriting it and is only done on these re-run paths.
+    """
+    ok, buf = cv2.imencode(os.path.splitext(path)[1] or ".png", img, params)
+    if not ok:
+        return "failed"
+    data = buf.tobytes()
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if skip_unchanged:
+        try:
+            st = os.stat(path)
+            if st.st_size == len(data):
+                with _written_digests_lock:
+                    known = _written_digests.get(path)
+                if known is not None and known[:2] == (st.st_size, st.st_mtime_ns):
+                    same = known[2] == digest
+                else:
+                    with open(path, "rb") as f:
+                        same = f.read() == data
+                if same:
+                    with _written_digests_lock:
+                        _written_digests[path] = (st.st_size, st.st_mtime_ns, digest)
+                    return "unchanged"
+        except OSError:
+            pass
+    with open(path, "wb") as f:
+        f.write(data)
+    try:
+        st = os.stat(path)
+        with _written_digests_lock:
+            _written_digests[path] = (st.st_size, st.st_mtime_ns, digest)
+    except OSError:
+        pass
+    return "written"
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+@lru_cache(maxsize=256)
+def _hex_to_bgr(hs):
+    """'#RRGGBB' -> (b, g, r), or None when not a 6-digit hex color. Class colors recur, so cached."""
+    try:
+        hs = str(hs).lstrip("#").strip()
+        # int(..., 16) also takes a sign or '_' separators; only plain hex digits are colors
+        if len(hs) != 6 or not _HEX_DIGITS.issuperset(hs):
+            return None
+        v = int(hs, 16)
+    except (TypeError, ValueError):
+        return None
+    return (v & 0xFF, (v >> 8) & 0xFF, (v >> 16) & 0xFF)
+
+
+def _build_label_metrics(font=cv2.FONT_HERSHEY_SIMPLEX, scale=0.6, thickness=2):
+    """Per-character advances for the fixed Step 3/4 label font, measured once at import."""
+    import string
+    adv = {}
+    for c in string.printable:
+        if c in "\t\n\r\x0b\x0c":
+            continue
+        # getTextSize adds the thickness once per string; x10 keeps the advance exact for 0.x scales
+        (w, _), _ = cv2.getTextSize(c * 10, font, scale, thickness)
+        adv[c] = (w - thickness) / 10.0
+    (_, h), _ = cv2.getTextSize("Hg", font, scale, thickness)
+    return adv, h  # Hershey text height does not depend on the string
+
+
+_LABEL_ADVANCE, _LABEL_TEXT_H = _build_label_metrics()
+_LABEL_ADVANCE_DEFAULT = _LABEL_ADVANCE.get("M", 12.0)
+
+
+def _label_text_size(text):
+    """(width, height) of a label as cv2.getTextSize(text, HERSHEY_SIMPLEX, 0.6, 2) reports it."""
+    adv = _LABEL_ADVANCE
+    return int(round(sum(adv.get(c, _LABEL_ADVANCE_DEFAULT) for c in text) + 2)), _LABEL_TEXT_H
+
+
+def _label_pos(W, H, x, y, w, h, text):
+    """Label origin for a box: clamped horizontally, above the box if it fits, else below, inside the image."""
+    tw, th = _label_text_size(text)
+    lx = max(0, min(W - tw - 1, x + 4))
+    if y - th - 6 >= 0:
+        ly = y - 6
+    else:
+        ly = min(H - 6, y + h + th)
+    ly = max(th, min(H - 1, ly))
+    return lx, ly
+
+
+def _padded_crop(img, bx, by, bw, bh, pad=50):
+    """View of img around the (bx, by, bw, bh) box plus pad, clamped to the image; img if empty."""
+    H, W = img.shape[:2]
+    x0, y0, x1, y1 = np.clip((bx - pad, by - pad, bx + bw + pad, by + bh + pad), 0, (W, H, W, H)).tolist()
+    crop = img[y0:y1, x0:x1]
+    return crop if crop.size else img
+
+
+def _indexed_pngs(directory, prefix):
+    """(idx, Path) for each '<prefix><idx>.png' in directory, sorted by the numeric idx."""
+    found = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith('.png')):
+                    continue
+                try:
+                    found.append((int(name[len(prefix):-4]), Path(entry.path)))
+                except ValueError:
+                    continue
+    except OSError:
+        return []
+    found.sort(key=lambda t: t[0])
+    return found
+
+
+def _draw_detections(img, dets, color_for, clamp_labels=True):
+    """Draw box + 'class score' label for each det in place; returns how many were drawn.
+
+    Bounds are gathered into one (N, 4) array so label placement is computed with NumPy;
+    only the actual draws go through cv2 per box. color_for(det) returning None skips a det.
+    """
+    boxes, colors, labels = [], [], []
+    for det in dets:
+        b = det.get('bounds')
+        if not b or len(b) < 4:
+            continue
+        b = b[:4]
+        if not all(isinstance(v, _REAL_TYPES) and math.isfinite(v) for v in b):
+            continue
+        box = [int(round(float(v))) for v in b]
+        color = color_for(det)
+        if color is None:
+            continue
+        label = str(det.get('class') or 'defect')
+        sc = det.get('score')
+        if isinstance(sc, _REAL_TYPES):
+            label = f"{label} {float(sc):.2f}"
+        boxes.append(box)
+        colors.append(color)
+        labels.append(label)
+    if not boxes:
+        return 0
+    x, y, w, h = np.asarray(boxes, dtype=np.int32).T
+    if clamp_labels:
+        # Keep text fully inside image: clamp horizontally, prefer above the box, else below.
+        H, W = img.shape[:2]
+        th = _LABEL_TEXT_H
+        tw = np.fromiter((_label_text_size(t)[0] for t in labels), dtype=np.int32, count=len(labels))
+        lx = np.maximum(0, np.minimum(W - tw - 1, x + 4))
+        ly = np.where(y - th - 6 >= 0, y - 6, np.minimum(H - 6, y + h + th))
+        ly = np.maximum(th, np.minimum(H - 1, ly))
+    else:
+        lx = x + 4
+        ly = np.maximum(0, y - 6)
+    x0, y0, x1, y1 = x.tolist(), y.tolist(), (x + w).tolist(), (y + h).tolist()
+    lx, ly = lx.tolist(), ly.tolist()
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    for i, color in enumerate(colors):
+        cv2.rectangle(img, (x0[i], y0[i]), (x1[i], y1[i]), color, 2)
+        cv2.putText(img, labels[i], (lx[i], ly[i]), font, 0.6, color, 2)
+    return len(colors)
+
+
+def _build_center_marker(radius=8):
+    """Pre-render the Step 2 center marker (blue dot, white ring) as a BGR stencil + mask."""
+    r = int(radius) + 2  # ring thickness 2 reaches past the radius
+    size = 2 * r + 1
+    stencil = np.zeros((size, size, 3), dtype=np.uint8)
+    mask = np.zeros((size, size), dtype=np.uint8)
+    cv2.circle(stencil, (r, r), radius, (255, 0, 0), -1)
+    cv2.circle(stencil, (r, r), radius, (255, 255, 255), 2)
+    cv2.circle(mask, (r, r), radius, 255, -1)
+    cv2.circle(mask, (r, r), radius, 255, 2)
+    return stencil, mask.astype(bool)
+
+
+_CENTER_STENCIL, _CENTER_MASK = _build_center_marker(8)
+_CENTER_HALF = _CENTER_STENCIL.shape[0] // 2
+
+
+def _order_detections_ccw(results, img_w, img_h):
+    """Number detections CCW around the image center, starting nearest bottom-right.
+
+    Writes det_center/center/center_ref/offset_top_px/index onto each detection
+    that has bounds; detections without bounds are left untouched.
+    """
+    cx0, cy0 = img_w / 2.0, img_h / 2.0
+    dets = [d for d in results if d.get('bounds')]
+    if not dets:
+        return
+    bounds = np.asarray([d['bounds'][:4] for d in dets], dtype=np.float64)
+    cx = bounds[:, 0] + bounds[:, 2] * 0.5
+    cy = bounds[:, 1] + bounds[:, 3] * 0.5
+    ang = np.arctan2(cy0 - cy, cx - cx0)  # 0 at right, CCW positive
+    # Start with the detection closest to bottom-right (-45 deg) and walk CCW
+    diff = np.abs(np.mod(ang + np.pi * 0.25 + np.pi, 2 * np.pi) - np.pi)
+    start = int(np.argmin(diff))
+    rank = np.mod(ang - ang[start], 2 * np.pi)
+    # Single write-back pass; det_center is the detection center, center/center_ref the image center
+    cx_l, cy_l = cx.tolist(), cy.tolist()
+    for i, j in enumerate(np.argsort(rank, kind='stable').tolist(), start=1):
+        dets[j].update({
+            'index': i,
+            'det_center': (cx_l[j], cy_l[j]),
+            'center': (cx0, cy0),
+            'center_ref': (cx0, cy0),
+            'offset_top_px': cx_l[j] - cx0,
+        })
+
+
+def _pick_center_detection(dets, img_w, img_h):
+    """Detection closest to the image center, ties broken by higher score.
+
+    Detections with missing or unparsable bounds rank last, as they did with
+    the per-detection key function this replaces.
+    """
+    n = len(dets)
+    bounds = np.full((n, 4), np.nan, dtype=np.float64)
+    scores = np.zeros(n, dtype=np.float64)
+    for i, d in enumerate(dets):
+        try:
+            b = d.get('bounds') or d.get('rect') or None
+            if not b or len(b) < 4:
+                continue
+            x, y, w, h = b
+            bounds[i] = (float(x), float(y), float(w), float(h))
+            scores[i] = float(d.get('score') or 0.0)
+        except Exception:
+            bounds[i] = np.nan
+            scores[i] = 0.0
+    cx = bounds[:, 0] + bounds[:, 2] * 0.5
+    cy = bounds[:, 1] + bounds[:, 3] * 0.5
+    dist2 = (cx - img_w * 0.5) ** 2 + (cy - img_h * 0.5) ** 2
+    dist2[np.isnan(dist2)] = np.inf
+    # lexsort keys are minor-first: distance, then higher score; stable like min()
+    return dets[int(np.lexsort((-scores, dist2))[0])]
+
 
 class _AxisUiBridge(QObject):
     set_ready = pyqtSignal(bool)
@@ -45,7 +382,7 @@ class MainWindow(QMainWindow):
     tt_message = pyqtSignal(str)
     tt_status = pyqtSignal(str)
     plc_snapshot = pyqtSignal(object)
-    live_frame_ready = pyqtSignal(str, int, object)  # (role, gen, frame)
+    live_frame_ready = pyqtSignal(str, int, object)  # (role, gen, unused); the image itself is in _live_pending
     live_error_ready = pyqtSignal(str, int, str, str)  # (role, gen, err_short, err_full)
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -55,6 +392,13 @@ class MainWindow(QMainWindow):
         self._last_top_detections = []
         self._attachment_defect_state = {}
         self._top_raw_np = None
+        self._defect_palette_bgr = None
+        self._class_palettes = {}
+        self._device_name_map = {}
+        # Model loads from the load buttons; bounded so repeated clicks queue instead of piling up threads
+        self._loader_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="model-load")
+        # Manual turntable/axis commands run one at a time, in click order, so PLC writes never overlap
+        self._hw_exec = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="hw")
 
         # Root splitter (left: workflow tabs, right: previews + ledger)
         root_splitter = QSplitter(Qt.Horizontal)
@@ -122,7 +466,13 @@ class MainWindow(QMainWindow):
         self._live_closed = False
         self._live_gen = {"Top": 0, "Front": 0}
         self._live_inflight = {"Top": None, "Front": None}
+        # Newest (gen, qimage, source_size) per role not yet shown; a newer capture overwrites an unshown one
+        self._live_pending = {"Top": None, "Front": None}
+        self._live_pending_lock = threading.Lock()
         self._live_err_ts = {"Top": 0.0, "Front": 0.0}
+        # (gen, target, frame) last converted per role (written only by that role's capture callback)
+        self._live_last_frame = {"Top": None, "Front": None}
+        self._live_pm = {"Top": None, "Front": None}
         self._live_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
         self._live_timer = QTimer(self)
         self._live_timer.setInterval(50)
@@ -130,9 +480,6 @@ class MainWindow(QMainWindow):
         self.live_frame_ready.connect(self._on_live_frame_ready)
         self.live_error_ready.connect(self._on_live_error_ready)
 
-        # Initial device list
-        self.on_camera_refresh()
-
         # No backend selection to restore (Detectron only)
 
         # Turntable panel signals
@@ -143,10 +490,18 @@ class MainWindow(QMainWindow):
         tt.rotate_requested.connect(self.on_turntable_rotate)
         tt.port_selected.connect(self.on_turntable_port_selected)
         tt.step_changed.connect(self.on_turntable_step_changed)
-        # Subscribe to turntable messages for logging (thread-safe via signal relay)
+        # Subscribe to turntable messages for logging (thread-safe via signal relay);
+        # WorkflowTab.append_log batches the lines into one append every 50 ms.
         self.tt_message.connect(self._handle_turntable_message)
         self.tt_status.connect(self._handle_turntable_status)
         self.plc_snapshot.connect(self._handle_plc_snapshot)
+        # PLC polls are coalesced: only the newest snapshot is applied, at most every 33 ms
+        self._plc_pending_snap = None
+        self._plc_axis_fields_last = None
+        self._plc_flush_timer = QTimer(self)
+        self._plc_flush_timer.setSingleShot(True)
+        self._plc_flush_timer.setInterval(33)
+        self._plc_flush_timer.timeout.connect(self._flush_plc_snapshot)
         self._tt_listener = self._on_tt_raw_message
         turntable_service.add_listener(self._tt_listener)
         try:
@@ -156,7 +511,6 @@ class MainWindow(QMainWindow):
         self._plc_connected_last = None
         self._plc_axis_cal_last = None
         self._plc_health_last = None
-        self.on_turntable_refresh()
 
         # Linear axis panel signals
         ax = self.workflow_tab.linear_axis_panel
@@ -166,13 +520,26 @@ class MainWindow(QMainWindow):
         ax.home_requested.connect(self.on_axis_home)
         ax.goto_requested.connect(self.on_axis_goto)
         ax.home_set_requested.connect(self.on_axis_home_set)
-        # Thread-safe axis UI bridge
+        # Thread-safe axis UI bridge: the emits come from _hw_exec workers, so these stay queued
+        # signals, but each one lands straight on the panel slot with no lambda in between.
         self._axis_ui = _AxisUiBridge()
         self._axis_ui.set_ready.connect(ax.set_ready)
         self._axis_ui.set_calibrating.connect(ax.set_calibrating)
-        self._axis_ui.set_calibrated.connect(lambda ok, p=None, t=None: ax.set_calibrated(ok, p if p is not None else None, total_steps=t))
-        self._axis_ui.set_position.connect(lambda p: ax.set_position(p))
-        # Initial axis ports
+        self._axis_ui.set_calibrated.connect(ax.set_calibrated)
+        self._axis_ui.set_position.connect(ax.set_position)
+        # Run Detection stays disabled until the tuner has been calibrated once
+        self._refresh_detection_gate()
+
+        # Device enumeration, connection restore and preview seeding run once the event
+        # loop is up, so the window paints before any hardware is probed.
+        QTimer.singleShot(0, self._post_show_init)
+
+    def _post_show_init(self):
+        if self._live_closed:
+            return
+        # Initial device lists
+        self.on_camera_refresh()
+        self.on_turntable_refresh()
         self.on_axis_refresh()
         # Seed linear axis home button with persisted value (even if PLC was already connected via the wizard).
         try:
@@ -211,11 +578,14 @@ class MainWindow(QMainWindow):
             else:
                 st = state()
                 if getattr(st, "plc_host", None):
-                    idx = self.workflow_tab.turntable_panel.port_combo.findText(str(st.plc_host))
-                    if idx >= 0:
-                        self.workflow_tab.turntable_panel.port_combo.setCurrentIndex(idx)
+                    self.workflow_tab.turntable_panel.select_host(str(st.plc_host))
                 if st.turntable_step is not None:
-                    self.workflow_tab.turntable_panel.step.setValue(float(st.turntable_step))
+                    step = self.workflow_tab.turntable_panel.step
+                    blocker = QSignalBlocker(step)
+                    try:
+                        step.setValue(float(st.turntable_step))
+                    finally:
+                        blocker.unblock()
         except Exception:
             pass
 
@@ -302,30 +672,35 @@ class MainWindow(QMainWindow):
             self._update_top_annotation()
 
     def _on_live_frame_ready(self, role: str, gen: int, frame):
-        if self._live_closed or not self._live_enabled:
-            return
         role_norm = "Top" if role == "Top" else "Front"
-        try:
-            if int(self._live_gen.get(role_norm, 0) or 0) != int(gen):
-                return
-        except Exception:
+        # The signal only wakes us up; paint whatever is newest in the slot and drop the rest
+        with self._live_pending_lock:
+            latest = self._live_pending.get(role_norm)
+            self._live_pending[role_norm] = None
+        if latest is None:
             return
-        if frame is None:
+        gen, qimg, src_size = latest
+        # Per-frame path: plain guards only; gen is always the int stamped by _on_live_tick
+        if self._live_closed or not self._live_enabled or qimg is None:
             return
-        try:
-            pm = np_bgr_to_qpixmap(frame)
-            if pm is None or pm.isNull():
+        if self._live_gen.get(role_norm, 0) != gen:
+            return
+        # Pixel work happened on the capture worker; only the pixmap upload is left here.
+        # One pixmap per role is refilled in place while the preview size holds.
+        pm = self._live_pm.get(role_norm)
+        if pm is not None and pm.size() == qimg.size():
+            if not pm.convertFromImage(qimg):
                 return
-            if role_norm == "Top":
-                self.preview_panel.set_original_np(pm)
-            else:
-                self.preview_panel.set_front_np(pm)
-            try:
-                self.workflow_tab.camera_panel.set_stream_status(role_norm, "Live feed: OK")
-            except Exception:
-                pass
-        except Exception:
-            pass
+        else:
+            pm = QPixmap.fromImage(qimg)
+            if pm.isNull():
+                return
+            self._live_pm[role_norm] = pm
+        if role_norm == "Top":
+            self.preview_panel.set_original_np(pm, src_size)
+        else:
+            self.preview_panel.set_front_np(pm, src_size)
+        self.workflow_tab.camera_panel.set_stream_status(role_norm, "Live feed: OK")
 
     def _on_live_error_ready(self, role: str, gen: int, err_short: str, err_full: str):
         if self._live_closed or not self._live_enabled:
@@ -382,6 +757,11 @@ class MainWindow(QMainWindow):
         self.preview_panel.set_front_preview_image(path)
 
     def on_run_detection(self):
+        # The run reads light settings from state; save any edit still waiting on its debounce
+        try:
+            self.workflow_tab.flush_pending_saves()
+        except Exception:
+            pass
         try:
             self._stop_live_feed()
         except Exception:
@@ -401,7 +781,10 @@ class MainWindow(QMainWindow):
             pass
         # Prepare capture directory structure based on date/time
         from datetime import datetime
-        import re
+        # Detection is gated on a saved tuner calibration (see _refresh_detection_gate)
+        if not self._refresh_detection_gate():
+            self.workflow_tab.append_log("[Detectron] Calibrate the edge/contour tuner to enable detection.")
+            return
         part_id_raw = ""
         try:
             part_id_raw = self.workflow_tab.part_id()
@@ -410,7 +793,7 @@ class MainWindow(QMainWindow):
         if not part_id_raw:
             QMessageBox.information(self, "Run Detection", "Please enter a Part ID before running detection.")
             return
-        part_id_clean = re.sub(r"[^A-Za-z0-9._-]+", "_", part_id_raw).strip("_")
+        part_id_clean = _UNSAFE_NAME_RE.sub("_", part_id_raw).strip("_")
         if not part_id_clean:
             part_id_clean = "part"
         try:
@@ -439,15 +822,6 @@ class MainWindow(QMainWindow):
             self._cycle_cap_dir = cap_dir
         except Exception:
             pass
-        # Offer to open tuner first if no saved contour params yet
-        try:
-            st = state()
-            if getattr(st, 'contour_params', None) is None:
-                resp = QMessageBox.question(self, "Edge/Contour Tuner", "Open tuner to calibrate edge/contour before detection?", QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
-                if resp == QMessageBox.Yes:
-                    self.on_open_tuner()
-        except Exception:
-            pass
         # Require project
         try:
             if not self._ensure_models_loaded(required=("top", "front", "defect"), show_dialog=True):
@@ -474,7 +848,7 @@ class MainWindow(QMainWindow):
                 if cap_dir is not None:
                     try:
                         raw_path = str((cap_dir / 'step-01_top_raw.png'))
-                        cv2.imwrite(raw_path, frame)
+                        cv2.imwrite(raw_path, frame, _STEP_IMG_PARAMS)
                         self.workflow_tab.append_log(f"[Capture] Saved raw: {raw_path}")
                         img_path = raw_path
                     except Exception:
@@ -483,7 +857,7 @@ class MainWindow(QMainWindow):
                 if not img_path:
                     try:
                         tmp = os.path.join(os.getcwd(), 'top_capture.png')
-                        cv2.imwrite(tmp, frame)
+                        cv2.imwrite(tmp, frame, _STEP_IMG_PARAMS)
                         img_path = tmp
                     except Exception:
                         pass
@@ -540,8 +914,9 @@ class MainWindow(QMainWindow):
             results = solvision_manager.detect(img_path)
             self.workflow_tab.append_log(f"[Detectron] Step 1 returned {len(results)} detection(s)")
             # Compute arrows + CCW numbering (counterclockwise) starting at bottom-right
+            src_for_arrows = None
             try:
-                import cv2 as _cv2, math
+                import cv2 as _cv2
                 from services import contour_tools as _ct
                 src_for_arrows = _cv2.imread(img_path)
                 if src_for_arrows is not None:
@@ -559,39 +934,7 @@ class MainWindow(QMainWindow):
                             pass
                     # Reference is exact image center (turntable center)
                     h, w = src_for_arrows.shape[:2]
-                    cx0, cy0 = w/2.0, h/2.0
-                    pts = []
-                    for d in results:
-                        b = d.get('bounds')
-                        if not b:
-                            continue
-                        x,y,w,h = b
-                        cx = x + w/2.0; cy = y + h/2.0
-                        # Store both detection center and image center for clarity
-                        d['det_center'] = (cx, cy)
-                        d['center'] = (cx0, cy0)      # image center
-                        d['center_ref'] = (cx0, cy0)
-                        d['offset_top_px'] = cx - cx0
-                        ang = math.atan2(cy0 - cy, cx - cx0)  # 0 at right, CCW positive
-                        pts.append((cx, cy, ang, d))
-                    if pts:
-                        # Start with the detection closest to bottom-right (315 deg) and walk CCW
-                        ref = -math.pi * 0.25  # -45 degrees
-                        def _ang_diff(a, b=ref):
-                            r = a - b
-                            while r <= -math.pi: r += 2*math.pi
-                            while r > math.pi: r -= 2*math.pi
-                            return abs(r)
-                        start = min(pts, key=lambda t: _ang_diff(t[2]))
-                        ang0 = start[2]
-                        def _rank(p):
-                            r = p[2] - ang0
-                            while r < 0: r += 2*math.pi
-                            while r >= 2*math.pi: r -= 2*math.pi
-                            return r
-                        pts.sort(key=_rank)
-                        for i, (_,_,_, d) in enumerate(pts, start=1):
-                            d['index'] = i
+                    _order_detections_ccw(results, w, h)
             except Exception as ex:
                 self.workflow_tab.append_log(f"[Detectron] Arrow computation skipped: {ex}")
             self.workflow_tab.populate_detection_results(results)
@@ -669,11 +1012,11 @@ class MainWindow(QMainWindow):
                         from pathlib import Path as _Path
                         import cv2 as _cv2
                         import numpy as _np
-                        import re as _re
                         from services import contour_tools as _ct
                         crops_dir = _Path(cap_dir) / 'step-01 cropped images'
                         crops_dir.mkdir(parents=True, exist_ok=True)
-                        src = _cv2.imread(img_path)
+                        # Reuse the frame decoded for arrow computation; only re-read if that failed
+                        src = src_for_arrows if src_for_arrows is not None else _cv2.imread(img_path)
                         if src is None:
                             self.workflow_tab.append_log("[Capture] Skipped crops: could not read source image")
                         else:
@@ -687,14 +1030,14 @@ class MainWindow(QMainWindow):
                                     items.append((0, det))
                             items.sort(key=lambda t: t[0])
 
-                            saved = 0
+                            # Validate and clamp every crop rect to image bounds up front
+                            rects = []
                             for _, det in items:
                                 idx = int(det.get('index', 0)) or 0
                                 b = det.get('bounds')
                                 if not b:
                                     continue
                                 x, y, w, h = b
-                                # Validate and clamp to image bounds
                                 try:
                                     x = int(max(0, x or 0)); y = int(max(0, y or 0))
                                     w = int(max(1, w or 0)); h = int(max(1, h or 0))
@@ -703,24 +1046,30 @@ class MainWindow(QMainWindow):
                                 if x >= iw or y >= ih:
                                     continue
                                 x2 = min(iw, x + w); y2 = min(ih, y + h)
-                                cw, ch = x2 - x, y2 - y
-                                if cw <= 0 or ch <= 0:
+                                if x2 - x <= 0 or y2 - y <= 0:
                                     continue
-                                crop = src[y:y2, x:x2].copy()
+                                rects.append((idx, det, x, y, x2, y2))
 
-                                # Use global arrow vector (anchor/vec) and map to crop coords
+                            # Annotate the full frame once; crops below are plain slices of it
+                            annotated = src.copy()
+                            for idx, det, x, y, _x2, _y2 in rects:
+                                # Global arrow vector (anchor/vec) in full-image coords
                                 arr = det.get('arrow') if isinstance(det, dict) else None
                                 if isinstance(arr, dict) and arr.get('anchor') and arr.get('vec'):
                                     anc = arr['anchor']; vec = arr['vec']
-                                    ax = int(anc[0] - x); ay = int(anc[1] - y)
-                                    ex = int(anc[0] + vec[0] - x); ey = int(anc[1] + vec[1] - y)
-                                    _cv2.arrowedLine(crop, (ax, ay), (ex, ey), (255, 0, 0), 2, tipLength=0.30)
-                                    # phi label on crop (yellow)
+                                    ax = int(anc[0]); ay = int(anc[1])
+                                    ex = int(anc[0] + vec[0]); ey = int(anc[1] + vec[1])
+                                    _cv2.arrowedLine(annotated, (ax, ay), (ex, ey), (255, 0, 0), 2, tipLength=0.30)
+                                    # phi label next to the arrow tip (yellow)
                                     phi = det.get('phi')
                                     if isinstance(phi, (int, float)):
-                                        _cv2.putText(crop, f"{phi:.3f}", (ex + 6, ey), _cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-                                # Put index top-left
-                                _cv2.putText(crop, f"{idx}", (5, 18), _cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 0), 2)
+                                        _cv2.putText(annotated, f"{phi:.3f}", (ex + 6, ey), _cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                                # Put index at the crop's top-left
+                                _cv2.putText(annotated, f"{idx}", (x + 5, y + 18), _cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 0), 2)
+
+                            saved = 0
+                            for idx, det, x, y, x2, y2 in rects:
+                                crop = annotated[y:y2, x:x2]
 
                                 # Build filename: det_###_{class}_{score}.png, ordered right->left
                                 label = det.get('class')
@@ -731,13 +1080,13 @@ class MainWindow(QMainWindow):
                                     score_str = None
                                 base = f"det_{idx:03d}"
                                 if label:
-                                    safe = _re.sub(r"[^A-Za-z0-9._-]+", "_", str(label))
+                                    safe = _UNSAFE_NAME_RE.sub("_", str(label))
                                     base += f"_{safe}"
                                 if score_str:
                                     base += f"_{score_str}"
                                 out_file = crops_dir / f"{base}.png"
                                 try:
-                                    _cv2.imwrite(str(out_file), crop)
+                                    _cv2.imwrite(str(out_file), crop, _STEP_IMG_PARAMS)
                                     saved += 1
                                 except Exception:
                                     pass
@@ -797,14 +1146,15 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             try:
-                self._run_step3_front(step2_dir)
+                crops = self._run_step3_front(step2_dir)
             except Exception as ex:
+                crops = None
                 try:
                     self.tt_message.emit(f"[Step3] Failed: {ex}")
                 except Exception:
                     pass
             try:
-                self._run_step4_defect(step2_dir)
+                self._run_step4_defect(step2_dir, crops)
             except Exception as ex:
                 try:
                     self.tt_message.emit(f"[Step4] Failed: {ex}")
@@ -862,7 +1212,7 @@ class MainWindow(QMainWindow):
                     try:
                         base = app_root()
                         tmp_path = str(base / "tuner_top.png")
-                        _cv2.imwrite(tmp_path, frame)
+                        _cv2.imwrite(tmp_path, frame, _STEP_IMG_PARAMS)
                         chosen_path = tmp_path
                     except Exception:
                         chosen_path = None
@@ -901,6 +1251,7 @@ class MainWindow(QMainWindow):
                     st = state(); st.contour_params = dict(dlg.params()); save_state()
                 except Exception:
                     pass
+                self._refresh_detection_gate()
                 img_path = getattr(self, "_last_capture_path", None)
                 if not img_path:
                     return
@@ -911,41 +1262,10 @@ class MainWindow(QMainWindow):
                     return
                 # Re-run detect quickly; compute arrows + CCW indices using contour
                 results = solvision_manager.detect(img_path)
-                import math
                 arrows, contour = _ct.compute_arrows_for_detections(src, results, params=dlg.params())
                 # Reference is exact image center (turntable center)
                 h, w = src.shape[:2]
-                cx0, cy0 = w/2.0, h/2.0
-                pts = []
-                for d in results:
-                    b = d.get('bounds')
-                    if not b:
-                        continue
-                    x,y,w,h = b
-                    cx = x + w/2.0; cy = y + h/2.0
-                    d['det_center'] = (cx, cy)
-                    d['center'] = (cx0, cy0)
-                    d['offset_top_px'] = cx - cx0
-                    ang = math.atan2(cy0 - cy, cx - cx0)
-                    pts.append((cx, cy, ang, d))
-                if pts:
-                    # Start with the detection closest to bottom-right (315 deg) and walk CCW
-                    ref = -math.pi * 0.25  # -45 degrees
-                    def _ang_diff(a, b=ref):
-                        r = a - b
-                        while r <= -math.pi: r += 2*math.pi
-                        while r > math.pi: r -= 2*math.pi
-                        return abs(r)
-                    start = min(pts, key=lambda t: _ang_diff(t[2]))
-                    ang0 = start[2]
-                    def _rank(p):
-                        r = p[2] - ang0
-                        while r < 0: r += 2*math.pi
-                        while r >= 2*math.pi: r -= 2*math.pi
-                        return r
-                    pts.sort(key=_rank)
-                    for i, (_,_,_, d) in enumerate(pts, start=1):
-                        d['index'] = i
+                _order_detections_ccw(results, w, h)
                 for det, arr in zip(results, arrows):
                     try:
                         if isinstance(arr, dict) and arr.get('anchor') and arr.get('vec'):
@@ -992,27 +1312,17 @@ class MainWindow(QMainWindow):
             self.workflow_tab.append_log(f"[PLC] Connection failed for {port}: {plc_service.last_error() or ''}".strip())
 
     def on_turntable_home(self):
-        # Run homing in a background thread to avoid blocking UI
-        import threading
-
+        # Run homing on the hardware worker to avoid blocking UI
         def run():
             res = turntable_service.home()
             self.tt_message.emit(res.message)
             status = res.message if res.success else f"Error: {res.message}"
             self.tt_status.emit(status)
 
-        threading.Thread(target=run, daemon=True).start()
+        self._hw_exec.submit(run)
 
     # ---- Step 2 pipeline: rotate per phi and capture front images ----
     def _run_step2_sequence(self, detections, cap_dir):
-        import threading, os, time
-        from pathlib import Path
-        import math
-        from services import turntable_service
-        from services import camera_service
-        from .qt_image import np_bgr_to_qpixmap
-        from PyQt5.QtCore import QTimer
-
         # Prepare folder
         step2_dir = Path(cap_dir) / 'step-02'
         try:
@@ -1046,12 +1356,16 @@ class MainWindow(QMainWindow):
             # Require models to be explicitly loaded by the user
             front_model = solvision_manager.current_project_path_for('front')
             defect_model = solvision_manager.current_project_path_for('defect')
-            try:
-                from services.config import state as _state
-                st_def = _state()
-                self._defect_thr_cached = getattr(st_def, "defect_score_threshold", None)
-            except Exception:
-                self._defect_thr_cached = None
+            # One AppState lookup for all per-run settings read below
+            cfg_run = state()
+            self._defect_thr_cached = cfg_run.defect_score_threshold
+            try:
+                defect_reduce = int(cfg_run.defect_decode_reduce or 0)
+            except (TypeError, ValueError):
+                defect_reduce = 0
+            emit_empty = bool(cfg_run.emit_empty_annotations)
+            # Step-04 indices handled in the pipeline, including empty results that wrote no PNG
+            step4_done = set()
             if not front_model:
                 self.tt_message.emit("[Step2] Front model not loaded; skipping rotation/front alignment.")
                 return
@@ -1059,92 +1373,153 @@ class MainWindow(QMainWindow):
             # Background executor to overlap step-03/04 with motions (single worker to keep Detectron safe)
             exec_bg = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             bg_futures = []
-
-            def _submit_step4(bbox_path, idx):
-                if not bbox_path or not defect_model:
-                    return
+            # Inspection-only snapshot writes; nothing downstream reads these files
+            save_exec = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+            # Turntable + axis moves for each index, reused across the whole sequence
+            motion_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='motion')
+
+            def _save_snapshot(path, img, label):
+                # Callers never mutate img after handing it over, so no copy is taken.
+                def _write():
+                    try:
+                        if cv2.imwrite(path, img, _DEBUG_IMG_PARAMS):
+                            self.tt_message.emit(f"[Step2] Saved {label}: {path}")
+                        else:
+                            self.tt_message.emit(f"[Step2] Failed to save {label}: {path}")
+                    except Exception as ex:
+                        self.tt_message.emit(f"[Step2] Save failed ({label}): {ex}")
                 try:
-                    f = exec_bg.submit(
-                        self._process_step4_single,
-                        bbox_path,
-                        idx,
-                        step4_dir,
-                        defect_model,
-                        self._defect_thr_cached,
-                    )
-                    bg_futures.append(f)
+                    save_exec.submit(_write)
                 except Exception as ex:
-                    try:
-                        self.tt_message.emit(f"[Step4] idx {idx}: submit failed: {ex}")
-                    except Exception:
-                        pass
+                    self.tt_message.emit(f"[Step2] Save failed ({label}): {ex}")
+
+            # Bound in-flight Step 3/4 work: each task pins a full crop, so when detection
+            # falls behind the motion loop waits here instead of queueing without limit.
+            bg_slots = threading.BoundedSemaphore(4)
 
-            def _submit_step3(crop_path, idx):
-                if not crop_path or not front_model:
+            def _write_step_png(path, img, tag):
+                # PNG encode + write go to save_exec so the Detectron worker moves on to the next crop;
+                # the outcome is logged from the job itself, so "saved" means the file is on disk
+                def _write():
+                    try:
+                        res = _imwrite_if_changed(path, img, _STEP_IMG_PARAMS)
+                    except Exception as ex:
+                        self.tt_message.emit(f"{tag}: save failed: {path}: {ex}")
+                        return
+                    if res == "failed":
+                        self.tt_message.emit(f"{tag}: save failed: {path}: encode error")
+                    else:
+                        self.tt_message.emit(f"{tag}: saved {path}")
+                save_exec.submit(_write)
+
+            def _step3_then_step4(crop, idx):
+                res3 = self._process_step3_single(crop, idx, step3_dir, front_model, emit_empty, _write_step_png)
+                if res3 and defect_model:
+                    # The bbox PNG is kept for re-runs and the fallback; Step 4 skips decoding it
+                    if self._process_step4_single(res3[1], idx, step4_dir, defect_model, self._defect_thr_cached,
+                                                  defect_reduce, emit_empty, _write_step_png):
+                        step4_done.add(idx)
+
+            def _submit_step3(crop, idx):
+                if crop is None or not front_model:
                     return
+                bg_slots.acquire()
                 try:
-                    f = exec_bg.submit(self._process_step3_single, crop_path, idx, step3_dir, front_model)
-                    bg_futures.append(f)
+                    f = exec_bg.submit(_step3_then_step4, crop, idx)
                 except Exception as ex:
+                    bg_slots.release()
                     try:
                         self.tt_message.emit(f"[Step3] idx {idx}: submit failed: {ex}")
                     except Exception:
                         pass
                     return
-
-                def _on_done(fut, _idx=idx):
-                    try:
-                        bbox_path = None
-                        try:
-                            bbox_path = fut.result()
-                        except Exception as inner_ex:
-                            try:
-                                self.tt_message.emit(f"[Step3] idx {_idx}: failed: {inner_ex}")
-                            except Exception:
-                                pass
-                            return
-                        _submit_step4(bbox_path, _idx)
-                    except Exception:
-                        pass
-
-                try:
-                    f.add_done_callback(_on_done)
-                except Exception:
-                    pass
+                f.add_done_callback(lambda _f: bg_slots.release())
+                bg_futures.append(f)
             # Snapshot helper (post to UI thread)
             def _show_front(frame):
                 try:
                     pm = frame if isinstance(frame, QPixmap) else np_bgr_to_qpixmap(frame)
-                    from PyQt5.QtCore import QTimer as _QTimer
-                    _QTimer.singleShot(0, lambda f=pm: self.defect_ledger.set_front_pixmap(f))
+                    QTimer.singleShot(0, lambda f=pm: self.defect_ledger.set_front_pixmap(f))
                 except Exception:
                     pass
             def _show_top(frame):
                 try:
                     pm = frame if isinstance(frame, QPixmap) else np_bgr_to_qpixmap(frame)
-                    from PyQt5.QtCore import QTimer as _QTimer
-                    _QTimer.singleShot(0, lambda f=pm: self.defect_ledger.set_top_pixmap(f))
+                    QTimer.singleShot(0, lambda f=pm: self.defect_ledger.set_top_pixmap(f))
                 except Exception:
                     pass
 
             # Move sequentially by index, but turntable and axis move simultaneously per index.
-            last_phi = 0.0
-            for d in ordered:
-                phi = d.get('phi')
-                idx = int(d.get('index', 0) or 0)
-                if not isinstance(phi, (int, float)):
-                    self.tt_message.emit(f"[Step2] Skipping index {idx}: missing phi.")
-                    continue
+            # Per-run axis constants: FOV and configured home are read once, and the
+            # top-px -> front-px -> steps chain is folded into one coefficient.
+            try:
+                top_fov_val = float(cfg_run.front_fov_top_px or DEFAULT_FRONT_FOV_TOP_PX)
+            except (TypeError, ValueError):
+                top_fov_val = 0.0
+            steps_per_top_px = (FRONT_IMAGE_WIDTH_PX * FRONT_STEPS_PER_PIXEL / top_fov_val) if abs(top_fov_val) > 1e-3 else None
+            home_steps_cfg = cfg_run.linear_axis_home_steps
+            # Crop size is fixed for the whole run so initial and corrected crops match
+            try:
+                crop_size = int(cfg_run.step2_crop_size or 1600)
+            except (TypeError, ValueError):
+                crop_size = 1600
+
+            # Helpers for robust moves
+            def _axis_move_safe(target: int) -> dict:
+                res = {"msg": None, "err": None}
+                try:
+                    curr = linear_axis_service.current_position_steps()
+                except Exception:
+                    curr = None
+                if curr is not None and abs(int(curr) - int(target)) <= 2:
+                    res["msg"] = "[INFO] Already at requested position."
+                    return res
+                try:
+                    move_res = linear_axis_service.goto_steps(int(target))
+                    if move_res.success:
+                        res["msg"] = move_res.message
+                    else:
+                        # Retry once if timed out
+                        low = (move_res.message or "").lower()
+                        if ("timed out" in low) or ("timeout" in low):
+                            retry = linear_axis_service.goto_steps(int(target))
+                            if retry.success:
+                                res["msg"] = retry.message + " (retried)"
+                            else:
+                                res["err"] = retry.message
+                        else:
+                            res["err"] = move_res.message
+                except Exception as ex:
+                    res["err"] = str(ex)
+                return res
 
-                # Compute turntable delta (deg) and desired actuator target (steps) for this detection.
-                move_deg = math.degrees(phi - last_phi)
-                last_phi = phi
+            def _tt_move_safe(delta_deg: float) -> dict:
+                res = {"msg": None, "err": None}
+                if abs(delta_deg) < 1e-3:
+                    res["msg"] = "[Turntable] Homing complete (already at zero)."
+                    return res
+                try:
+                    msg = turntable_service.move_relative(delta_deg)
+                    res["msg"] = msg
+                except Exception as ex:
+                    # Retry once
+                    try:
+                        msg = turntable_service.move_relative(delta_deg)
+                        res["msg"] = msg + " (retried)"
+                    except Exception as ex2:
+                        res["err"] = str(ex2)
+                return res
+
+            def _start_moves(d, move_deg):
+                """Compute the axis target for detection d and start its turntable + axis moves.
 
+                Returns (futures, tt_res, ax_res, target_steps, axis_reason); the result dicts are
+                filled in once the futures are done.
+                """
                 target_steps = None
                 axis_reason = None
                 try:
                     if linear_axis_service.is_calibrated():
-                        from services.config import state as _state
                         total_steps = linear_axis_service.calibration_total_steps()
                         if total_steps is None:
                             axis_reason = "invalid calibration (total steps unavailable)"
@@ -1153,24 +1528,11 @@ class MainWindow(QMainWindow):
                             off_top = float(d.get('offset_top_rot_px', d.get('offset_top_px', 0.0)) or 0.0)
                         except Exception:
                             off_top = 0.0
-                        st_axis = _state()
-                        top_fov_val = getattr(st_axis, "front_fov_top_px", None) or DEFAULT_FRONT_FOV_TOP_PX
-                        try:
-                            top_fov_val = float(top_fov_val)
-                        except (TypeError, ValueError):
-                            top_fov_val = 0.0
-                        if abs(top_fov_val) > 1e-3:
-                            delta_px = (off_top / top_fov_val) * FRONT_IMAGE_WIDTH_PX
-                            # Convert pixel offset into actuator steps using calibrated pixel-to-step factor.
-                            try:
-                                cfg = _state()
-                                home_steps = getattr(cfg, "linear_axis_home_steps", None)
-                                if home_steps is None:
-                                    home_steps = int(total_steps) // 2
-                            except Exception:
-                                home_steps = int(total_steps) // 2
-                            delta_steps = int(round(float(delta_px) * float(FRONT_STEPS_PER_PIXEL)))
-                            tgt_steps = int(home_steps) + int(delta_steps)
+                        if steps_per_top_px is not None:
+                            # Top-image offset -> front-image pixels -> actuator steps, relative to home.
+                            home_steps = home_steps_cfg if home_steps_cfg is not None else int(total_steps) // 2
+                            delta_steps = int(round(off_top * steps_per_top_px))
+                            tgt_steps = int(home_steps) + delta_steps
                             target_steps = max(0, min(int(total_steps), int(tgt_steps)))
                         else:
                             axis_reason = "invalid front FOV"
@@ -1179,54 +1541,7 @@ class MainWindow(QMainWindow):
                 except Exception as ex:
                     axis_reason = f"axis alignment failed: {ex}"
 
-                # Helpers for robust moves
-                def _axis_move_safe(target: int) -> dict:
-                    res = {"msg": None, "err": None}
-                    try:
-                        curr = linear_axis_service.current_position_steps()
-                    except Exception:
-                        curr = None
-                    if curr is not None and abs(int(curr) - int(target)) <= 2:
-                        res["msg"] = "[INFO] Already at requested position."
-                        return res
-                    try:
-                        move_res = linear_axis_service.goto_steps(int(target))
-                        if move_res.success:
-                            res["msg"] = move_res.message
-                        else:
-                            # Retry once if timed out
-                            low = (move_res.message or "").lower()
-                            if ("timed out" in low) or ("timeout" in low):
-                                retry = linear_axis_service.goto_steps(int(target))
-                                if retry.success:
-                                    res["msg"] = retry.message + " (retried)"
-                                else:
-                                    res["err"] = retry.message
-                            else:
-                                res["err"] = move_res.message
-                    except Exception as ex:
-                        res["err"] = str(ex)
-                    return res
-
-                def _tt_move_safe(delta_deg: float) -> dict:
-                    res = {"msg": None, "err": None}
-                    if abs(delta_deg) < 1e-3:
-                        res["msg"] = "[Turntable] Homing complete (already at zero)."
-                        return res
-                    try:
-                        msg = turntable_service.move_relative(delta_deg)
-                        res["msg"] = msg
-                    except Exception as ex:
-                        # Retry once
-                        try:
-                            msg = turntable_service.move_relative(delta_deg)
-                            res["msg"] = msg + " (retried)"
-                        except Exception as ex2:
-                            res["err"] = str(ex2)
-                    return res
-
                 # Fire moves concurrently
-                import threading
                 tt_res = {"msg": None, "err": None}
                 ax_res = {"msg": None, "err": axis_reason}
 
@@ -1235,18 +1550,34 @@ class MainWindow(QMainWindow):
                     tt_res.update(r)
 
                 def _move_axis():
-                    if target_steps is None:
-                        return
                     r = _axis_move_safe(int(target_steps))
                     ax_res.update(r)
 
-                threads = []
-                t1 = threading.Thread(target=_move_tt, daemon=True); threads.append(t1); t1.start()
+                futs = [motion_pool.submit(_move_tt)]
                 if target_steps is not None:
-                    t2 = threading.Thread(target=_move_axis, daemon=True); threads.append(t2); t2.start()
+                    futs.append(motion_pool.submit(_move_axis))
+                return futs, tt_res, ax_res, target_steps, axis_reason
+
+            # Turntable delta (deg) per index, taken from the previous index with a valid phi
+            plan = []
+            last_phi = 0.0
+            for d in ordered:
+                phi = d.get('phi')
+                idx = int(d.get('index', 0) or 0)
+                if not isinstance(phi, (int, float)):
+                    self.tt_message.emit(f"[Step2] Skipping index {idx}: missing phi.")
+                    continue
+                plan.append((d, idx, math.degrees(phi - last_phi)))
+                last_phi = phi
 
-                for t in threads:
-                    t.join()
+            # Moves for the next index, started as soon as the current corrected frame is captured
+            next_moves = None
+            for pos, (d, idx, move_deg) in enumerate(plan):
+                moves = next_moves or _start_moves(d, move_deg)
+                next_moves = None
+                motion_futs, tt_res, ax_res, target_steps, axis_reason = moves
+                for fut in motion_futs:
+                    fut.result()
 
                 # Log results
                 if tt_res["err"]:
@@ -1273,23 +1604,33 @@ class MainWindow(QMainWindow):
                 # Capture from cameras if available and update previews
                 try:
                     top_snapshot = None
-                    # Top camera preview update (keep latest frame for debugging)
-                    if cammgr.is_connected("Top"):
+                    # Top camera preview update (keep latest frame for debugging); runs
+                    # alongside the front initial capture/detect and is joined before the
+                    # corrected front capture so it never interleaves with it.
+                    top_box = [None]
+                    top_thread = None
+
+                    def _grab_top():
                         try:
-                            top_frame = cammgr.capture("Top")
-                            top_snapshot = self._ensure_bgr8(top_frame)
-                            _show_top(top_snapshot)
+                            top_frame = cammgr.capture_latest("Top")
+                            top_box[0] = self._ensure_bgr8(top_frame)
+                            _show_top(top_box[0])
                         except Exception as ex:
-                            top_snapshot = None
+                            top_box[0] = None
                             self.tt_message.emit(f"[Step2] Top snapshot failed: {ex}")
+
+                    def _join_top():
+                        if top_thread is not None:
+                            top_thread.join()
+                        return top_box[0]
+
+                    if cammgr.is_connected("Top"):
+                        top_thread = threading.Thread(target=_grab_top, daemon=True)
+                        top_thread.start()
                     # Front camera preview, detect, correct, and crop
                     if cammgr.is_connected("Front"):
-                        import cv2 as _cv2
-                        import numpy as _np
-                        from services.config import state as _state
-
                         def _capture_front():
-                            frame = cammgr.capture("Front")
+                            frame = cammgr.capture_latest("Front")
                             return self._ensure_bgr8(frame)
 
                         def _center_crop(img, crop_size):
@@ -1299,39 +1640,36 @@ class MainWindow(QMainWindow):
                             cy = Hc // 2
                             x0 = max(0, cx - half); x1 = min(Wc, cx + half)
                             y0 = max(0, cy - half); y1 = min(Hc, cy + half)
-                            crop = img[y0:y1, x0:x1].copy()
+                            # View into img; only frames smaller than crop_size get a resized copy
+                            crop = img[y0:y1, x0:x1]
                             if crop.shape[0] != crop_size or crop.shape[1] != crop_size:
-                                crop = _cv2.resize(crop, (crop_size, crop_size))
+                                crop = cv2.resize(crop, (crop_size, crop_size))
                             return crop
 
-                        # first capture at current alignment
-                        overlay = _capture_front()
-                        initial_raw_path = None
+                        # The top grab is joined even if the front capture raises, so its frame and
+                        # error message are not lost while the snapshot block unwinds
+                        front_ok = False
                         try:
-                            initial_raw_path = str(step2_dir / f"step-02_front_initial_{idx:03d}.png")
-                            _cv2.imwrite(initial_raw_path, overlay)
-                            self.tt_message.emit(f"[Step2] Saved initial front snapshot: {initial_raw_path}")
-                        except Exception:
-                            initial_raw_path = None
+                            # first capture at current alignment
+                            overlay = _capture_front()
+                            _save_snapshot(str(step2_dir / f"step-02_front_initial_{idx:03d}.png"), overlay, "initial front snapshot")
 
-                        try:
-                            st2 = _state(); crop_size = int(getattr(st2, 'step2_crop_size', None) or 1600)
-                        except Exception:
-                            crop_size = 1600
-                        crop = _center_crop(overlay, crop_size)
-                        initial_crop_path = str(step2_dir / f"step-02_front_crop_initial_{idx:03d}.png")
-                        try:
-                            _cv2.imwrite(initial_crop_path, crop)
-                        except Exception:
-                            pass
+                            crop = np.ascontiguousarray(_center_crop(overlay, crop_size))
+                            # Detection reads the array directly; the PNG is kept for inspection only
+                            _save_snapshot(str(step2_dir / f"step-02_front_crop_initial_{idx:03d}.png"), crop, "initial crop")
 
-                        # Run front detection on the initial crop
-                        dets = []
-                        try:
-                            dets = solvision_manager.detect_for('front', initial_crop_path)
-                        except Exception as ex:
-                            self.tt_message.emit(f"[Step2] Front detect failed: {ex}")
+                            # Run front detection on the initial crop
                             dets = []
+                            try:
+                                dets = solvision_manager.detect_for('front', crop)
+                            except Exception as ex:
+                                self.tt_message.emit(f"[Step2] Front detect failed: {ex}")
+                                dets = []
+                            front_ok = True
+                        finally:
+                            top_snapshot = _join_top()
+                            if not front_ok and top_snapshot is not None:
+                                _save_snapshot(str(step2_dir / f"step-02_top_{idx:03d}.png"), top_snapshot, "top snapshot")
 
                         if not dets:
                             self.tt_message.emit(f"[Step2] No detection in crop idx {idx}; discarding filling.")
@@ -1340,24 +1678,21 @@ class MainWindow(QMainWindow):
                         # Pick detection closest to crop center
                         cx_crop = crop.shape[1] / 2.0
                         cy_crop = crop.shape[0] / 2.0
-                        def _center_of(det):
-                            b = det.get("bounds")
-                            if not b:
-                                return (None, None)
-                            x1, y1, w, h = b
-                            return (x1 + w / 2.0, y1 + h / 2.0)
-                        det = min(dets, key=lambda dd: float('inf') if _center_of(dd)[0] is None else abs(_center_of(dd)[0] - cx_crop) + abs(_center_of(dd)[1] - cy_crop))
-                        dcx, dcy = _center_of(det)
-                        if dcx is None:
+                        bounds = np.asarray([dd["bounds"][:4] for dd in dets if dd.get("bounds")], dtype=np.float64)
+                        if bounds.size == 0:
                             self.tt_message.emit(f"[Step2] Detection missing center; discarding idx {idx}.")
                             continue
-                        dx_px = dcx - cx_crop  # + => bbox to the right of center
+                        off_x = bounds[:, 0] + bounds[:, 2] * 0.5 - cx_crop
+                        off_y = bounds[:, 1] + bounds[:, 3] * 0.5 - cy_crop
+                        best = int(np.argmin(np.abs(off_x) + np.abs(off_y)))
+                        dx_px = float(off_x[best])  # + => bbox to the right of center
                         # Convert pixel offset to actuator steps using front camera scale.
                         try:
                             total_steps = linear_axis_service.calibration_total_steps()
                         except Exception:
                             total_steps = None
 
+                        corrected_moved = False
                         if not total_steps or total_steps <= 0:
                             self.tt_message.emit("[Step2] Correction skipped: actuator calibration invalid (total steps unavailable).")
                         else:
@@ -1366,11 +1701,7 @@ class MainWindow(QMainWindow):
                             except Exception:
                                 curr_steps = None
                             if curr_steps is None:
-                                try:
-                                    cfg = _state()
-                                    curr_steps = getattr(cfg, "linear_axis_home_steps", None)
-                                except Exception:
-                                    curr_steps = None
+                                curr_steps = home_steps_cfg
                             if curr_steps is None:
                                 curr_steps = int(total_steps) // 2
 
@@ -1380,6 +1711,7 @@ class MainWindow(QMainWindow):
                             tol_steps = max(1, int(round((0.05 / 100.0) * float(total_steps))))
 
                             if abs(dx_steps) > tol_steps:
+                                corrected_moved = True
                                 try:
                                     corr_res = _axis_move_safe(new_target)
                                     if corr_res["err"]:
@@ -1395,27 +1727,36 @@ class MainWindow(QMainWindow):
                                     f"[Step2] Alignment within tolerance (dx={dx_px:.2f}px -> {dx_steps} steps); no correction move."
                                 )
 
-                        # Capture corrected frame after a short settle to avoid motion blur
-                        try:
-                            time.sleep(0.1)
-                        except Exception:
-                            pass
-                        # Capture corrected frame
-                        overlay = _capture_front()
-                        corrected_raw_path = None
-                        try:
-                            corrected_raw_path = str(step2_dir / f"step-02_front_corrected_{idx:03d}.png")
-                            _cv2.imwrite(corrected_raw_path, overlay)
-                            self.tt_message.emit(f"[Step2] Saved corrected front snapshot: {corrected_raw_path}")
-                        except Exception:
-                            corrected_raw_path = None
+                        # Capture corrected frame after a short settle to avoid motion blur. Without
+                        # a correction move nothing has moved since the initial capture, so reuse it.
+                        # Keep the raw buffer for the step-3 crop and annotate a separate copy.
+                        if corrected_moved:
+                            try:
+                                time.sleep(0.1)
+                            except Exception:
+                                pass
+                            corrected_raw = _capture_front()
+                        else:
+                            corrected_raw = overlay
+                        _save_snapshot(str(step2_dir / f"step-02_front_corrected_{idx:03d}.png"), corrected_raw, "corrected front snapshot")
+                        # Nothing below moves the hardware or reads the cameras, so the next index's
+                        # rotation can run while this frame is annotated, cropped and handed to Step 3.
+                        if pos + 1 < len(plan):
+                            next_d, _next_idx, next_deg = plan[pos + 1]
+                            next_moves = _start_moves(next_d, next_deg)
+                        overlay = corrected_raw.copy()
 
                         H, W = overlay.shape[:2]
                         x_mark = W // 2
                         midy = H // 2
                         try:
-                            _cv2.circle(overlay, (x_mark, midy), 8, (255, 0, 0), -1)
-                            _cv2.circle(overlay, (x_mark, midy), 8, (255, 255, 255), 2)
+                            y0m, x0m = midy - _CENTER_HALF, x_mark - _CENTER_HALF
+                            if y0m >= 0 and x0m >= 0 and y0m + _CENTER_STENCIL.shape[0] <= H and x0m + _CENTER_STENCIL.shape[1] <= W:
+                                roi = overlay[y0m:y0m + _CENTER_STENCIL.shape[0], x0m:x0m + _CENTER_STENCIL.shape[1]]
+                                roi[_CENTER_MASK] = _CENTER_STENCIL[_CENTER_MASK]
+                            else:
+                                cv2.circle(overlay, (x_mark, midy), 8, (255, 0, 0), -1)
+                                cv2.circle(overlay, (x_mark, midy), 8, (255, 255, 255), 2)
                         except Exception:
                             pass
 
@@ -1427,36 +1768,16 @@ class MainWindow(QMainWindow):
                             pass
 
                         # Save annotated and crop corrected center for downstream step 3
-                        try:
-                            fn_front = str(step2_dir / f"step-02_front_{idx:03d}.png")
-                            if _cv2.imwrite(fn_front, overlay):
-                                self.tt_message.emit(f"[Step2] Saved front snapshot (annotated): {fn_front}")
-                            else:
-                                self.tt_message.emit(f"[Step2] Failed to save front snapshot: {fn_front}")
-                        except Exception as ex:
-                            self.tt_message.emit(f"[Step2] Save failed: {ex}")
+                        _save_snapshot(str(step2_dir / f"step-02_front_{idx:03d}.png"), overlay, "front snapshot (annotated)")
 
                         try:
                             crops_dir = step2_dir / 'step_2_cropped'
                             crops_dir.mkdir(parents=True, exist_ok=True)
+                            crop_final = np.ascontiguousarray(_center_crop(corrected_raw, crop_size))
+                            # Step 3 gets the array directly; the PNG is kept for re-runs only
+                            _save_snapshot(str(crops_dir / f"step-02_front_crop_{idx:03d}.png"), crop_final, "corrected crop")
                             try:
-                                st2 = _state(); crop_size = int(getattr(st2, 'step2_crop_size', None) or 1600)
-                            except Exception:
-                                crop_size = 1600
-                            raw_img = None
-                            try:
-                                if corrected_raw_path:
-                                    raw_img = _cv2.imread(corrected_raw_path)
-                            except Exception:
-                                raw_img = None
-                            if raw_img is None:
-                                raw_img = overlay.copy()
-                            crop_final = _center_crop(raw_img, crop_size)
-                            out_path = str(crops_dir / f"step-02_front_crop_{idx:03d}.png")
-                            _cv2.imwrite(out_path, crop_final)
-                            self.tt_message.emit(f"[Step2] Saved corrected crop: {out_path}")
-                            try:
-                                _submit_step3(out_path, idx)
+                                _submit_step3(crop_final, idx)
                             except Exception:
                                 pass
                         except Exception as ex:
@@ -1464,24 +1785,17 @@ class MainWindow(QMainWindow):
 
                         # Clear preview markers so the next filling starts clean
                         try:
-                            from PyQt5.QtCore import QTimer as _QTimer
-                            _QTimer.singleShot(0, lambda: self.preview_panel.set_front_markers([]))
+                            QTimer.singleShot(0, lambda: self.preview_panel.set_front_markers([]))
                         except Exception:
                             pass
 
                         # Save latest top snapshot alongside the front capture if available
                         if top_snapshot is not None:
-                            try:
-                                fn_top = str(step2_dir / f"step-02_top_{idx:03d}.png")
-                                if _cv2.imwrite(fn_top, top_snapshot):
-                                    self.tt_message.emit(f"[Step2] Saved top snapshot: {fn_top}")
-                                else:
-                                    self.tt_message.emit(f"[Step2] Failed to save top snapshot: {fn_top}")
-                            except Exception as ex:
-                                self.tt_message.emit(f"[Step2] Top save failed: {ex}")
+                            _save_snapshot(str(step2_dir / f"step-02_top_{idx:03d}.png"), top_snapshot, "top snapshot")
 
                         _show_front(overlay)
                     else:
+                        _join_top()
                         self.tt_message.emit("[Step2] Front camera not connected; snapshot skipped.")
                 except Exception as ex:
                     self.tt_message.emit(f"[Step2] Snapshot failed: {ex}")
@@ -1489,16 +1803,7 @@ class MainWindow(QMainWindow):
             # Wait for any pipelined Step3/4 tasks; fall back to sequential if none were scheduled
             try:
                 if bg_futures:
-                    try:
-                        while True:
-                            snapshot = list(bg_futures)
-                            pending = [f for f in snapshot if not f.done()]
-                            if not pending:
-                                break
-                            concurrent.futures.wait(pending, return_when=concurrent.futures.ALL_COMPLETED)
-                    except Exception:
-                        pass
-                    for fut in list(bg_futures):
+                    for fut in concurrent.futures.as_completed(bg_futures):
                         try:
                             fut.result()
                         except Exception as ex:
@@ -1508,12 +1813,13 @@ class MainWindow(QMainWindow):
                                 pass
                 else:
                     # Backward-compatible sequential processing
+                    crops = None
                     try:
-                        self._run_step3_front(step2_dir)
+                        crops = self._run_step3_front(step2_dir)
                     except Exception as ex:
                         self.tt_message.emit(f"[Step3] Failed: {ex}")
                     try:
-                        self._run_step4_defect(step2_dir)
+                        self._run_step4_defect(step2_dir, crops)
                     except Exception as ex:
                         self.tt_message.emit(f"[Step4] Failed: {ex}")
             finally:
@@ -1521,38 +1827,44 @@ class MainWindow(QMainWindow):
                     exec_bg.shutdown(wait=True)
                 except Exception:
                     pass
-            # Fallback: ensure every bbox in step-03 has a step-04 result
+                try:
+                    save_exec.shutdown(wait=True)
+                except Exception:
+                    pass
+                try:
+                    motion_pool.shutdown(wait=True)
+                except Exception:
+                    pass
+            # Step-04 already ran per index above; only bboxes without an output are redone.
+            # Inference is serialized per model inside detect_for, so the pool overlaps
+            # reads, annotation and writes with the model.
             try:
-                bbox_files = sorted(step3_dir.glob('step-03_front_bbox_*.png'))
-                for p in bbox_files:
-                    try:
-                        import re as _re
-                        m = _re.search(r"_(\d+)\.png$", p.name)
-                        idx_fallback = int(m.group(1)) if m else 0
-                    except Exception:
-                        idx_fallback = 0
-                    expected = step4_dir / f"step-04_defect_{idx_fallback:03d}.png"
-                    if expected.exists():
-                        continue
+                missing = []
+                for idx_p, p in _indexed_pngs(step3_dir, 'step-03_front_bbox_'):
+                    if idx_p not in step4_done and not (step4_dir / f"step-04_defect_{idx_p:03d}.png").exists():
+                        missing.append((p, idx_p))
+
+                def _step4_one(item):
+                    p, idx_p = item
                     try:
-                        self.tt_message.emit(f"[Step4] Fallback running idx {idx_fallback} from {p.name}")
+                        self.tt_message.emit(f"[Step4] Fallback running idx {idx_p} from {p.name}")
                     except Exception:
                         pass
                     try:
-                        self._process_step4_single(str(p), idx_fallback, step4_dir, defect_model, self._defect_thr_cached)
+                        self._process_step4_single(str(p), idx_p, step4_dir, defect_model, self._defect_thr_cached,
+                                                   defect_reduce, emit_empty)
                     except Exception as ex:
                         try:
-                            self.tt_message.emit(f"[Step4] Fallback idx {idx_fallback} failed: {ex}")
+                            self.tt_message.emit(f"[Step4] Fallback idx {idx_p} failed: {ex}")
                         except Exception:
                             pass
-            except Exception:
-                pass
-            # Final sweep: rerun step-04 sequentially over all bboxes to guarantee outputs
-            try:
-                self._run_step4_defect(step2_dir)
+
+                if missing:
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(missing))) as pool4:
+                        list(pool4.map(_step4_one, missing))
             except Exception as ex:
                 try:
-                    self.tt_message.emit(f"[Step4] Final sweep failed: {ex}")
+                    self.tt_message.emit(f"[Step4] Fallback failed: {ex}")
                 except Exception:
                     pass
             # Home the turntable at the end
@@ -1567,8 +1879,7 @@ class MainWindow(QMainWindow):
             try:
                 if linear_axis_service.is_connected() and linear_axis_service.is_calibrated():
                     try:
-                        from services.config import state as _state
-                        cfg = _state()
+                        cfg = state()
                         hs = getattr(cfg, "linear_axis_home_steps", None)
                         if hs is None:
                             total = linear_axis_service.calibration_total_steps()
@@ -1586,8 +1897,8 @@ class MainWindow(QMainWindow):
             # Record cycle time from button press to post-home
             try:
                 elapsed = time.time() - cycle_start
+                # cap_dir is per cycle and already exists (step-02 was created inside it)
                 ct_path = Path(cap_dir) / "cycle_time.txt"
-                ct_path.parent.mkdir(parents=True, exist_ok=True)
                 with ct_path.open("a", encoding="ascii") as f:
                     f.write(f"{elapsed:.2f}\n")
                 self.tt_message.emit(f"[Step2] Cycle time recorded: {elapsed:.2f} s -> {ct_path}")
@@ -1598,33 +1909,46 @@ class MainWindow(QMainWindow):
 
     # ---- Helpers ----
     def _ensure_bgr8(self, img):
-        import numpy as _np
-        import cv2 as _cv2
-
         if img is None:
-            return _np.zeros((10, 10, 3), dtype=_np.uint8)
+            return np.zeros((10, 10, 3), dtype=np.uint8)
 
         arr = img
+        # uint8 mono is already in range: duplicate planes only, no stretch (as camera_service does)
         if arr.ndim == 2:
-            return _cv2.cvtColor(self._to_uint8(arr), _cv2.COLOR_GRAY2BGR)
+            if arr.dtype == np.uint8:
+                return cv2.cvtColor(arr, cv2.COLOR_GRAY2BGR)
+            return cv2.cvtColor(self._to_uint8(arr), cv2.COLOR_GRAY2BGR)
         if arr.ndim == 3 and arr.shape[2] == 1:
+            if arr.dtype == np.uint8:
+                return cv2.cvtColor(np.ascontiguousarray(arr[:, :, 0]), cv2.COLOR_GRAY2BGR)
             single = self._to_uint8(arr[:, :, 0])
-            return _cv2.cvtColor(single, _cv2.COLOR_GRAY2BGR)
+            return cv2.cvtColor(single, cv2.COLOR_GRAY2BGR)
         if arr.ndim == 3 and arr.shape[2] >= 3:
-            if arr.dtype == _np.uint8:
+            if arr.dtype == np.uint8:
                 return arr.copy()
-            channels = [self._to_uint8(arr[:, :, c]) for c in range(3)]
-            return _cv2.merge(channels)
+            try:
+                # One de-interleave pass; each plane is stretched on its own so the
+                # per-channel balance is unchanged (a 3-channel normalize uses a global range)
+                planes = cv2.split(np.ascontiguousarray(arr[:, :, :3]))
+            except Exception:
+                planes = [arr[:, :, c] for c in range(3)]
+            return cv2.merge([self._to_uint8(p) for p in planes])
         return arr
 
     def _to_uint8(self, channel):
-        import numpy as _np
-        arr = channel.astype(_np.float32, copy=False)
+        if channel.size == 0:
+            return np.zeros_like(channel, dtype=np.uint8)
+        try:
+            # Single min-max stretch pass; constant input maps to 0 like the fallback below
+            return cv2.normalize(np.ascontiguousarray(channel), None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+        except Exception:
+            pass  # dtypes OpenCV does not handle (e.g. int64)
+        arr = channel.astype(np.float32, copy=False)
         mn, mx = arr.min(), arr.max()
         if mx - mn < 1e-6:
-            return _np.zeros_like(channel, dtype=_np.uint8)
+            return np.zeros_like(channel, dtype=np.uint8)
         norm = (arr - mn) / (mx - mn)
-        return (norm * 255.0).clip(0, 255).astype(_np.uint8)
+        return (norm * 255.0).clip(0, 255).astype(np.uint8)
 
     def on_turntable_port_selected(self, port: str):
         try:
@@ -1650,6 +1974,17 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _refresh_detection_gate(self) -> bool:
+        try:
+            ready = getattr(state(), "contour_params", None) is not None
+        except Exception:
+            ready = False
+        try:
+            self.workflow_tab.set_detection_enabled(ready)
+        except Exception:
+            pass
+        return ready
+
     def _ensure_models_loaded(self, required=("top",), show_dialog=False) -> bool:
         missing = []
         try:
@@ -1683,6 +2018,17 @@ class MainWindow(QMainWindow):
             pass
 
     def _handle_plc_snapshot(self, snap):
+        self._plc_pending_snap = snap
+        if not self._plc_flush_timer.isActive():
+            self._plc_flush_timer.start()
+
+    def _flush_plc_snapshot(self):
+        snap = self._plc_pending_snap
+        self._plc_pending_snap = None
+        if snap is not None:
+            self._apply_plc_snapshot(snap)
+
+    def _apply_plc_snapshot(self, snap):
         """
         Keep UI connection state in sync with the shared PLC service.
         Note: Avoid spamming panel status labels on every poll; only update
@@ -1724,6 +2070,7 @@ class MainWindow(QMainWindow):
                     except Exception:
                         pass
                     self._plc_axis_cal_last = None
+                    self._plc_axis_fields_last = None
 
             self._plc_connected_last = connected
 
@@ -1783,19 +2130,23 @@ class MainWindow(QMainWindow):
             except Exception:
                 act_fault_code = None
 
-            # Update read-only PLC axis details (does not touch goto input).
-            try:
-                self.workflow_tab.linear_axis_panel.set_plc_axis_snapshot(
-                    position_steps=pos_steps,
-                    target_steps=act_target_steps,
-                    in_motion=act_in_motion,
-                    act_state=act_state,
-                    act_fault_code=act_fault_code,
-                    calibrated=cal,
-                    total_steps=total if total > 0 else None,
-                )
-            except Exception:
-                pass
+            # Update read-only PLC axis details (does not touch goto input); skipped when unchanged.
+            axis_fields = (pos_steps, act_target_steps, act_in_motion, act_state, act_fault_code, cal,
+                           total if total > 0 else None)
+            if axis_fields != self._plc_axis_fields_last:
+                try:
+                    self.workflow_tab.linear_axis_panel.set_plc_axis_snapshot(
+                        position_steps=pos_steps,
+                        target_steps=act_target_steps,
+                        in_motion=act_in_motion,
+                        act_state=act_state,
+                        act_fault_code=act_fault_code,
+                        calibrated=cal,
+                        total_steps=axis_fields[6],
+                    )
+                    self._plc_axis_fields_last = axis_fields
+                except Exception:
+                    pass
 
             # One-time migration: convert legacy mm home/last into steps when calibration total is known.
             try:
@@ -1840,8 +2191,6 @@ class MainWindow(QMainWindow):
         self.workflow_tab.turntable_panel.set_status(status)
 
     def on_turntable_rotate(self, angle: float):
-        import threading
-
         def run():
             try:
                 msg = turntable_service.move_relative(angle)
@@ -1851,7 +2200,7 @@ class MainWindow(QMainWindow):
                 self.tt_message.emit(f"Rotation failed: {ex}")
                 self.tt_status.emit(str(ex))
 
-        threading.Thread(target=run, daemon=True).start()
+        self._hw_exec.submit(run)
 
     def on_axis_refresh(self):
         try:
@@ -1859,23 +2208,19 @@ class MainWindow(QMainWindow):
             self.workflow_tab.linear_axis_panel.set_ports(ports)
             st = state()
             if getattr(st, "plc_host", None):
-                combo = self.workflow_tab.linear_axis_panel.port_combo
-                idx = combo.findText(str(st.plc_host))
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
+                self.workflow_tab.linear_axis_panel.select_host(str(st.plc_host))
         except Exception as ex:
             self.workflow_tab.append_log(f"[Axis] Refresh failed: {ex}")
 
     def on_axis_connect(self, port: str):
-        from PyQt5.QtCore import QTimer as _QTimer
         if linear_axis_service.connect(port):
             endpoint = linear_axis_service.port_name() or port
-            _QTimer.singleShot(0, lambda ep=endpoint: self.workflow_tab.linear_axis_panel.set_connected(True, ep))
-            _QTimer.singleShot(0, lambda: self.workflow_tab.linear_axis_panel.set_ready(True))
-            _QTimer.singleShot(0, lambda ep=endpoint: self.workflow_tab.append_log(f"[PLC] Connected to {ep}."))
+            QTimer.singleShot(0, lambda ep=endpoint: self.workflow_tab.linear_axis_panel.set_connected(True, ep))
+            QTimer.singleShot(0, lambda: self.workflow_tab.linear_axis_panel.set_ready(True))
+            QTimer.singleShot(0, lambda ep=endpoint: self.workflow_tab.append_log(f"[PLC] Connected to {ep}."))
             # PLC is shared; reflect connection in turntable panel too.
             try:
-                _QTimer.singleShot(0, lambda ep=endpoint: self.workflow_tab.turntable_panel.set_connected(True, ep))
+                QTimer.singleShot(0, lambda ep=endpoint: self.workflow_tab.turntable_panel.set_connected(True, ep))
             except Exception:
                 pass
             try:
@@ -1892,7 +2237,7 @@ class MainWindow(QMainWindow):
                     hs = getattr(cfg, "linear_axis_last_steps", None)
                 if hs is None:
                     hs = 0
-                _QTimer.singleShot(0, lambda steps=int(hs): self.workflow_tab.linear_axis_panel.set_home_steps(steps))
+                QTimer.singleShot(0, lambda steps=int(hs): self.workflow_tab.linear_axis_panel.set_home_steps(steps))
             except Exception:
                 pass
             # Seed calibration/position state from PLC status
@@ -1900,18 +2245,16 @@ class MainWindow(QMainWindow):
                 cal = linear_axis_service.is_calibrated()
                 pos_steps = linear_axis_service.current_position_steps()
                 total_steps = linear_axis_service.calibration_total_steps()
-                _QTimer.singleShot(
+                QTimer.singleShot(
                     0,
                     lambda c=cal, p=pos_steps, t=total_steps: self.workflow_tab.linear_axis_panel.set_calibrated(bool(c), p if c else None, total_steps=t),
                 )
             except Exception:
                 pass
         else:
-            _QTimer.singleShot(0, lambda: self.workflow_tab.append_log(f"[PLC] Connection failed for {port}: {plc_service.last_error() or ''}".strip()))
+            QTimer.singleShot(0, lambda: self.workflow_tab.append_log(f"[PLC] Connection failed for {port}: {plc_service.last_error() or ''}".strip()))
 
     def on_axis_calibrate(self):
-        import threading
-
         # Guard against concurrent calibrations
         try:
             if self.workflow_tab.linear_axis_panel.is_calibrating():
@@ -1924,10 +2267,12 @@ class MainWindow(QMainWindow):
             if linear_axis_service.is_calibrated():
                 self.workflow_tab.append_log("[Axis] Already calibrated (PLC reports calibration valid). Skipping calibration.")
                 try:
+                    # Already on the GUI thread: call the panel directly instead of bouncing through the bridge
                     pos_steps = linear_axis_service.current_position_steps()
                     total_steps = linear_axis_service.calibration_total_steps()
-                    self._axis_ui.set_calibrated.emit(True, pos_steps, total_steps)
-                    self._axis_ui.set_ready.emit(True)
+                    ax = self.workflow_tab.linear_axis_panel
+                    ax.set_calibrated(True, pos_steps, total_steps)
+                    ax.set_ready(True)
                 except Exception:
                     pass
                 return
@@ -1979,11 +2324,9 @@ class MainWindow(QMainWindow):
             finally:
                 self._axis_ui.set_calibrating.emit(False)
 
-        threading.Thread(target=run, daemon=True).start()
+        self._hw_exec.submit(run)
 
     def on_axis_home(self, home_steps: int):
-        import threading
-
         def run():
             try:
                 res = linear_axis_service.home(home_steps=int(home_steps))
@@ -1999,11 +2342,9 @@ class MainWindow(QMainWindow):
             except Exception as ex:
                 self.workflow_tab.append_log(f"[Axis] Home failed: {ex}")
 
-        threading.Thread(target=run, daemon=True).start()
+        self._hw_exec.submit(run)
 
     def on_axis_goto(self, target_steps: int):
-        import threading
-
         def run():
             try:
                 res = linear_axis_service.goto_steps(int(target_steps))
@@ -2019,7 +2360,7 @@ class MainWindow(QMainWindow):
             except Exception as ex:
                 self.workflow_tab.append_log(f"[Axis] Move failed: {ex}")
 
-        threading.Thread(target=run, daemon=True).start()
+        self._hw_exec.submit(run)
 
     def on_axis_home_set(self, home_steps: int):
         try:
@@ -2028,58 +2369,58 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _process_step3_single(self, crop_path, idx, step3_dir, front_path):
-        import cv2 as _cv2
-        from services import solvision_manager
+    def _process_step3_single(self, crop, idx, step3_dir, front_path, emit_empty=True, writer=None):
+        """Run step 3 on one step-02 crop, given either as a BGR ndarray or a file path.
+
+        Returns (bbox_png_path, bbox_array) for Step 4, or None when there is no bbox.
+        writer(path, img, tag) takes over the PNG writes when given and logs each outcome under tag
+        once the write is done; img is not touched afterwards.
+        """
 
+        is_array = isinstance(crop, np.ndarray)
+        if writer is None:
+            def writer(path, arr, tag):
+                if cv2.imwrite(path, arr, _STEP_IMG_PARAMS):
+                    self.tt_message.emit(f"{tag}: saved {path}")
+                else:
+                    self.tt_message.emit(f"{tag}: save failed: {path}")
         try:
             if not front_path:
                 self.tt_message.emit("[Step3] No front_attachment model loaded; skipping.")
                 return None
-            if not os.path.isfile(crop_path):
-                self.tt_message.emit(f"[Step3] idx {idx}: crop not found: {crop_path}")
+            if not is_array and not os.path.isfile(crop):
+                self.tt_message.emit(f"[Step3] idx {idx}: crop not found: {crop}")
                 return None
         except Exception:
             return None
 
         try:
-            img = _cv2.imread(str(crop_path))
+            img = crop if is_array else cv2.imread(str(crop))
             if img is None:
-                self.tt_message.emit(f"[Step3] idx {idx}: failed to read {crop_path}")
+                self.tt_message.emit(f"[Step3] idx {idx}: failed to read {crop}")
                 return None
             H, W = img.shape[:2]
             dets = []
             try:
-                dets = solvision_manager.detect_for('front', str(crop_path))
+                dets = solvision_manager.detect_for('front', img)
             except Exception as ex:
                 self.tt_message.emit(f"[Step3] idx {idx}: detect failed: {ex}")
                 dets = []
 
             if not dets:
-                ann = img.copy()
-                _cv2.putText(ann, 'No detection', (20, 40), _cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0,0,255), 2)
+                _remove_stale_step3(step3_dir, idx, annotation=not emit_empty)
+                if not emit_empty:
+                    self.tt_message.emit(f"[Step3] idx {idx}: no detection")
+                    return None
+                # Arrays from Step 2 are shared with its background PNG save; files are ours to draw on
+                ann = img.copy() if is_array else img
+                cv2.putText(ann, 'No detection', (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0,0,255), 2)
                 out_ann = str(step3_dir / f"step-03_front_{idx:03d}.png")
-                _cv2.imwrite(out_ann, ann)
-                self.tt_message.emit(f"[Step3] idx {idx}: no detection; saved {out_ann}")
+                self.tt_message.emit(f"[Step3] idx {idx}: no detection")
+                writer(out_ann, ann, f"[Step3] idx {idx}")
                 return None
 
-            cx0, cy0 = W * 0.5, H * 0.5
-
-            def _metric(d):
-                try:
-                    b = d.get('bounds') or d.get('rect') or None
-                    if not b or len(b) < 4:
-                        return (float('inf'), -0.0)
-                    x, y, w, h = b
-                    x = float(x); y = float(y); w = float(w); h = float(h)
-                    cx = x + w * 0.5; cy = y + h * 0.5
-                    dist2 = (cx - cx0) ** 2 + (cy - cy0) ** 2
-                    sc = float(d.get('score') or 0.0)
-                    return (dist2, -sc)
-                except Exception:
-                    return (float('inf'), -0.0)
-
-            best = min(dets, key=_metric)
+            best = _pick_center_detection(dets, W, H)
             bx, by, bw, bh = best.get('bounds') or (0, 0, 0, 0)
             try:
                 bx = int(round(float(bx))); by = int(round(float(by)))
@@ -2089,28 +2430,17 @@ class MainWindow(QMainWindow):
             bx = max(0, min(W - 1, bx)); by = max(0, min(H - 1, by))
             bw = max(0, min(W - bx, bw)); bh = max(0, min(H - by, bh))
 
-            ann = img.copy()
-            def _safe_label_pos(x, y, w, h, text):
-                (tw, th), _ = _cv2.getTextSize(text, _cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
-                lx = max(0, min(W - tw - 1, x + 4))
-                if y - th - 6 >= 0:
-                    ly = y - 6
-                else:
-                    ly = min(H - 6, y + h + th)
-                ly = max(th, min(H - 1, ly))
-                return lx, ly
-            def _hex_to_bgr(hex_str):
-                try:
-                    hs = hex_str.lstrip("#")
-                    if len(hs) == 6:
-                        r = int(hs[0:2], 16); g = int(hs[2:4], 16); b = int(hs[4:6], 16)
-                        return (b, g, r)
-                except Exception:
-                    pass
-                return (0, 255, 0)
+            # Save the bbox crop from the clean frame first so annotations can go onto it directly
+            crop = _padded_crop(img, bx, by, bw, bh)
+            # Step 4 takes the pixels from memory; a file-backed img is drawn on below, so detach
+            bbox_arr = crop if is_array else crop.copy()
+            out_crop = str(step3_dir / f"step-03_front_bbox_{idx:03d}.png")
+            writer(out_crop, bbox_arr, f"[Step3] idx {idx}")
 
-            color = _hex_to_bgr(best.get("color"))
-            _cv2.rectangle(ann, (bx, by), (bx + bw, by + bh), color, 2)
+            # Arrays from Step 2 are shared with its background PNG save; files are ours to draw on
+            ann = img.copy() if is_array else img
+            color = _hex_to_bgr(best.get("color")) or (0, 255, 0)
+            cv2.rectangle(ann, (bx, by), (bx + bw, by + bh), color, 2)
             label = str(best.get('class') or '')
             try:
                 sc = best.get('score')
@@ -2119,25 +2449,12 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             if label:
-                lx, ly = _safe_label_pos(bx, by, bw, bh, label)
-                _cv2.putText(ann, label, (lx, ly), _cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                lx, ly = _label_pos(W, H, bx, by, bw, bh, label)
+                cv2.putText(ann, label, (lx, ly), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
 
             out_ann = str(step3_dir / f"step-03_front_{idx:03d}.png")
-            _cv2.imwrite(out_ann, ann)
-
-            pad = 50
-            x0 = max(0, bx - pad)
-            y0 = max(0, by - pad)
-            x1 = min(W, bx + bw + pad)
-            y1 = min(H, by + bh + pad)
-            if x1 <= x0 or y1 <= y0:
-                crop = img.copy()
-            else:
-                crop = img[y0:y1, x0:x1].copy()
-            out_crop = str(step3_dir / f"step-03_front_bbox_{idx:03d}.png")
-            _cv2.imwrite(out_crop, crop)
-            self.tt_message.emit(f"[Step3] idx {idx}: saved {out_ann} and bbox {out_crop}")
-            return out_crop
+            writer(out_ann, ann, f"[Step3] idx {idx}")
+            return out_crop, bbox_arr
         except Exception as ex:
             try:
                 self.tt_message.emit(f"[Step3] idx {idx}: failed: {ex}")
@@ -2145,116 +2462,135 @@ class MainWindow(QMainWindow):
                 pass
             return None
 
-    def _process_step4_single(self, bbox_path, idx, step4_dir, defect_path, override_thr=None):
-        import cv2 as _cv2
+    def _get_defect_palette(self):
+        # Parsed once per defect model; reset in on_load_defect_file
+        cached = self._defect_palette_bgr
+        if cached is not None:
+            return cached
         from services import solvision_manager
 
+        palette_bgr = []
+        try:
+            cols = solvision_manager.class_colors_for('defect')
+            if cols:
+                palette_bgr = [c for c in map(_hex_to_bgr, cols) if c is not None]
+        except Exception:
+            palette_bgr = []
+        if not palette_bgr:
+            # Hard fallback to known defect palette
+            palette_bgr = [_hex_to_bgr(hs) for hs in ["#FCFF8A", "#7FD47F", "#ECA360", "#6AD0FF", "#4A4A4A"]]
+        else:
+            # Only cache model colors; the fallback is retried until metadata is available
+            self._defect_palette_bgr = palette_bgr
+        return palette_bgr
+
+    def _class_palette(self, role):
+        # Positional BGR colors (class_id -> color or None) per model; reset when that model reloads
+        cached = self._class_palettes.get(role)
+        if cached is not None:
+            return cached
+        try:
+            palette = [_hex_to_bgr(hs) for hs in (solvision_manager.class_colors_for(role) or [])]
+        except Exception:
+            return []
+        if palette:
+            self._class_palettes[role] = palette
+        return palette
+
+    def _process_step4_single(self, bbox_path, idx, step4_dir, defect_path, override_thr=None, decode_reduce=0,
+                              emit_empty=True, writer=None):
+        """Run the defect model on one Step 3 bbox crop (ndarray or PNG path).
+
+        Returns True once the crop has a verdict. writer(path, img, tag) takes over the PNG write when
+        given and logs its outcome once the write is done.
+        """
+        is_array = isinstance(bbox_path, np.ndarray)
         try:
             if not defect_path:
                 self.tt_message.emit("[Step4] No defect model loaded; skipping.")
                 return
-            if not os.path.isfile(bbox_path):
+            if not is_array and not os.path.isfile(bbox_path):
                 self.tt_message.emit(f"[Step4] idx {idx}: bbox not found: {bbox_path}")
                 return
         except Exception:
             return
 
         try:
-            img = _cv2.imread(str(bbox_path))
-            if img is None:
+            model_img = _read_defect_input(bbox_path, decode_reduce)
+            if model_img is None:
                 self.tt_message.emit(f"[Step4] idx {idx}: failed to read {bbox_path}")
                 return
-            # Precompute palette once
-            palette_bgr = []
-            try:
-                cols = solvision_manager.class_colors_for('defect')
-                if cols:
-                    for hs in cols:
-                        try:
-                            hs = str(hs).lstrip("#").strip()
-                            if len(hs) == 6:
-                                r = int(hs[0:2], 16); g = int(hs[2:4], 16); b = int(hs[4:6], 16)
-                                palette_bgr.append((b, g, r))
-                        except Exception:
-                            continue
-            except Exception:
-                palette_bgr = []
-            if not palette_bgr:
-                # Hard fallback to known defect palette
-                for hs in ["#FCFF8A", "#7FD47F", "#ECA360", "#6AD0FF", "#4A4A4A"]:
-                    try:
-                        hs = hs.lstrip("#")
-                        if len(hs) == 6:
-                            r = int(hs[0:2], 16); g = int(hs[2:4], 16); b = int(hs[4:6], 16)
-                            palette_bgr.append((b, g, r))
-                    except Exception:
-                        continue
+            palette_bgr = self._get_defect_palette()
             palette_fallback = palette_bgr[0] if palette_bgr else (255, 200, 0)
             dets = []
             try:
-                dets = solvision_manager.detect_for('defect', str(bbox_path), score_threshold=override_thr)
+                dets = solvision_manager.detect_for('defect', model_img, score_threshold=override_thr)
             except Exception as ex:
                 self.tt_message.emit(f"[Step4] idx {idx}: detect failed: {ex}")
                 dets = []
 
-            ann = img.copy()
+            if not dets and not emit_empty:
+                self.tt_message.emit(f"[Step4] idx {idx}: no defects")
+                try:
+                    self._set_defect_state(idx, "ok")
+                except Exception:
+                    pass
+                return True
+
+            # Annotations are drawn on the full-size crop, decoded here only when the model saw a reduced one
+            img = _full_size_crop(bbox_path, model_img, decode_reduce)
+            if img is None:
+                self.tt_message.emit(f"[Step4] idx {idx}: failed to read {bbox_path}")
+                return
+            if is_array:
+                # The array may view the Step 2 crop still queued for saving; annotate a private copy
+                img = img.copy()
+            dets = _scale_detections(dets, img.shape[1] / model_img.shape[1], img.shape[0] / model_img.shape[0])
+
+            # img is private to this call (a copy or a fresh full-size decode, not the model input).
+            # writer may encode it later on save_exec, so it must not be touched once handed over.
+            ann = img
             state = "ok"
             if not dets:
                 # No detections; still use palette color instead of red
-                _cv2.putText(ann, 'No defects', (20, 40), _cv2.FONT_HERSHEY_SIMPLEX, 1.0, palette_fallback, 2)
+                cv2.putText(ann, 'No defects', (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, palette_fallback, 2)
             else:
                 state = "fail"
-                for det in dets:
-                    b = det.get('bounds')
-                    if not b or len(b) < 4:
-                        continue
-                    x, y, w, h = b
-                    try:
-                        x = int(round(float(x))); y = int(round(float(y)))
-                        w = int(round(float(w))); h = int(round(float(h)))
-                    except Exception:
-                        continue
-                    try:
-                        cid = det.get("class_id")
-                        cid_idx = int(cid) if cid is not None else 0
-                    except Exception:
-                        cid_idx = 0
+
+                def _color_for(det):
+                    cid = det.get("class_id")
+                    cid_idx = int(cid) if isinstance(cid, _REAL_TYPES) else 0
                     if cid_idx < 0 or cid_idx >= len(palette_bgr):
                         cid_idx = 0
-                    color = palette_bgr[cid_idx] if palette_bgr else palette_fallback
-                    _cv2.rectangle(ann, (x, y), (x + w, y + h), color, 2)
-                    label = str(det.get('class') or 'defect')
-                    try:
-                        sc = det.get('score')
-                        if sc is not None:
-                            label = f"{label} {float(sc):.2f}"
-                    except Exception:
-                        pass
-                    if label:
-                        _cv2.putText(ann, label, (x + 4, max(0, y - 6)), _cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                    return palette_bgr[cid_idx] if palette_bgr else palette_fallback
+
+                _draw_detections(ann, dets, _color_for, clamp_labels=False)
 
             out_ann = str(step4_dir / f"step-04_defect_{idx:03d}.png")
-            _cv2.imwrite(out_ann, ann)
-            self.tt_message.emit(f"[Step4] idx {idx}: saved {out_ann}")
+            if writer is not None:
+                writer(out_ann, ann, f"[Step4] idx {idx}")
+            else:
+                res = _imwrite_if_changed(out_ann, ann, _STEP_IMG_PARAMS, skip_unchanged=True)
+                if res == "failed":
+                    self.tt_message.emit(f"[Step4] idx {idx}: save failed: {out_ann}: encode error")
+                elif res == "unchanged":
+                    self.tt_message.emit(f"[Step4] idx {idx}: unchanged {out_ann}")
+                else:
+                    self.tt_message.emit(f"[Step4] idx {idx}: saved {out_ann}")
             try:
                 self._set_defect_state(idx, state)
             except Exception:
                 pass
+            return True
         except Exception as ex:
             try:
                 self.tt_message.emit(f"[Step4] idx {idx}: failed: {ex}")
             except Exception:
                 pass
+        return False
     # ---- Step 3: run front-attachment detectron on step-02 crops ----
     def _run_step3_front(self, step2_dir):
-        from pathlib import Path as _Path
-        import re as _re
-        import cv2 as _cv2
-        import numpy as _np
-        from services.config import state as _state
-        from services import solvision_manager
-
-        step2_dir = _Path(step2_dir)
+        step2_dir = Path(step2_dir)
         crops_dir = step2_dir / 'step_2_cropped'
         if not crops_dir.exists():
             self.tt_message.emit("[Step3] No step-02 crops found; skipping.")
@@ -2272,46 +2608,43 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        files = sorted([p for p in crops_dir.glob('step-02_front_crop_*.png')])
-        rx = _re.compile(r"step-02_front_crop_(\d+)\.png$", _re.IGNORECASE)
-        total = 0
-        for p in files:
-            m = rx.search(p.name)
-            if not m:
-                continue
-            idx = int(m.group(1))
+        jobs = _indexed_pngs(crops_dir, 'step-02_front_crop_')
+        # Front class colors by class_id, parsed once per model load
+        front_palette = self._class_palette('front')
+        emit_empty = bool(getattr(state(), "emit_empty_annotations", None))
+
+        # Crops are independent: decode, annotation and writes run concurrently while
+        # detect_for serializes the model calls themselves
+        crops = {}
+
+        def _step3_one(job):
+            idx, p = job
             try:
-                img = _cv2.imread(str(p))
+                img = cv2.imread(str(p))
                 if img is None:
                     self.tt_message.emit(f"[Step3] idx {idx}: failed to read {p}")
-                    continue
-                dets = solvision_manager.detect_for('front', str(p))
+                    return 0
+                try:
+                    dets = solvision_manager.detect_for('front', img)
+                except Exception as ex:
+                    self.tt_message.emit(f"[Step3] idx {idx}: detect failed: {ex}")
+                    dets = []
                 H, W = img.shape[:2]
                 if not dets:
+                    _remove_stale_step3(step3_dir, idx, annotation=not emit_empty)
+                    if not emit_empty:
+                        self.tt_message.emit(f"[Step3] idx {idx}: no detection")
+                        return 1
                     # Save an annotated image with note
-                    ann = img.copy()
-                    _cv2.putText(ann, 'No detection', (20, 40), _cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0,0,255), 2)
+                    cv2.putText(img, 'No detection', (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0,0,255), 2)
                     out_ann = str(step3_dir / f"step-03_front_{idx:03d}.png")
-                    _cv2.imwrite(out_ann, ann)
+                    if not cv2.imwrite(out_ann, img, _STEP_IMG_PARAMS):
+                        self.tt_message.emit(f"[Step3] idx {idx}: no detection; save failed: {out_ann}")
+                        return 0
                     self.tt_message.emit(f"[Step3] idx {idx}: no detection; saved {out_ann}")
-                    total += 1
-                    continue
+                    return 1
                 # Choose detection closest to image center (tie-break by higher score)
-                cx0, cy0 = W * 0.5, H * 0.5
-                def _metric(d):
-                    try:
-                        b = d.get('bounds') or d.get('rect') or None
-                        if not b or len(b) < 4:
-                            return (float('inf'), -0.0)
-                        x, y, w, h = b
-                        x = float(x); y = float(y); w = float(w); h = float(h)
-                        cx = x + w * 0.5; cy = y + h * 0.5
-                        dist2 = (cx - cx0) ** 2 + (cy - cy0) ** 2
-                        sc = float(d.get('score') or 0.0)
-                        return (dist2, -sc)
-                    except Exception:
-                        return (float('inf'), -0.0)
-                best = min(dets, key=_metric)
+                best = _pick_center_detection(dets, W, H)
                 bx, by, bw, bh = best.get('bounds') or (0, 0, 0, 0)
                 try:
                     bx = int(round(float(bx))); by = int(round(float(by)))
@@ -2322,33 +2655,24 @@ class MainWindow(QMainWindow):
                 bx = max(0, min(W - 1, bx)); by = max(0, min(H - 1, by))
                 bw = max(0, min(W - bx, bw)); bh = max(0, min(H - by, bh))
 
-                ann = img.copy()
-                def _safe_label_pos(x, y, w, h, text):
-                    # Clamp horizontally; prefer above box, else below while keeping inside image.
-                    (tw, th), _ = _cv2.getTextSize(text, _cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
-                    lx = max(0, min(W - tw - 1, x + 4))
-                    if y - th - 6 >= 0:
-                        ly = y - 6
-                    else:
-                        ly = min(H - 6, y + h + th)
-                    ly = max(th, min(H - 1, ly))
-                    return lx, ly
-
-                def _color_from_meta(det_obj, role='front'):
-                    try:
-                        cid = det_obj.get("class_id")
-                        colors = solvision_manager.class_colors_for(role)
-                        if colors and cid is not None and 0 <= int(cid) < len(colors):
-                            hs = colors[int(cid)].lstrip("#")
-                            if len(hs) == 6:
-                                r = int(hs[0:2], 16); g = int(hs[2:4], 16); b = int(hs[4:6], 16)
-                                return (b, g, r)
-                    except Exception:
-                        pass
-                    return (0, 255, 0)
+                # Save bbox crop before annotating so the drawing can go onto img directly
+                crop = _padded_crop(img, bx, by, bw, bh)
+                out_crop = str(step3_dir / f"step-03_front_bbox_{idx:03d}.png")
+                if not cv2.imwrite(out_crop, crop, _STEP_IMG_PARAMS):
+                    self.tt_message.emit(f"[Step3] idx {idx}: save failed: {out_crop}")
+                # Step 4 consumes this crop in memory; copy it since img gets annotated below
+                crops[idx] = crop.copy()
 
-                color = _color_from_meta(best, 'front')
-                _cv2.rectangle(ann, (bx, by), (bx + bw, by + bh), color, 2)
+                color = None
+                try:
+                    cid = best.get("class_id")
+                    if cid is not None and 0 <= int(cid) < len(front_palette):
+                        color = front_palette[int(cid)]
+                except Exception:
+                    pass
+                if color is None:
+                    color = (0, 255, 0)
+                cv2.rectangle(img, (bx, by), (bx + bw, by + bh), color, 2)
                 label = str(best.get('class') or '')
                 try:
                     sc = best.get('score')
@@ -2357,47 +2681,41 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
                 if label:
-                    lx, ly = _safe_label_pos(bx, by, bw, bh, label)
-                    _cv2.putText(ann, label, (lx, ly), _cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                    lx, ly = _label_pos(W, H, bx, by, bw, bh, label)
+                    cv2.putText(img, label, (lx, ly), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
 
                 out_ann = str(step3_dir / f"step-03_front_{idx:03d}.png")
-                _cv2.imwrite(out_ann, ann)
-
-                # Save bbox crop
-                pad = 50
-                x0 = max(0, bx - pad)
-                y0 = max(0, by - pad)
-                x1 = min(W, bx + bw + pad)
-                y1 = min(H, by + bh + pad)
-                crop = img[y0:y1, x0:x1].copy() if (x1 > x0 and y1 > y0) else img.copy()
-                out_crop = str(step3_dir / f"step-03_front_bbox_{idx:03d}.png")
-                _cv2.imwrite(out_crop, crop)
+                if not cv2.imwrite(out_ann, img, _STEP_IMG_PARAMS):
+                    self.tt_message.emit(f"[Step3] idx {idx}: save failed: {out_ann}")
+                    return 0
                 self.tt_message.emit(f"[Step3] idx {idx}: saved {out_ann} and bbox {out_crop}")
-                total += 1
+                return 1
             except Exception as ex:
                 self.tt_message.emit(f"[Step3] idx {idx}: failed: {ex}")
+                return 0
+
+        total = 0
+        if jobs:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4, len(jobs))) as pool:
+                total = sum(pool.map(_step3_one, jobs))
         self.tt_message.emit(f"[Step3] Done. Processed {total} cropped image(s)")
+        return crops
 
     # ---- Step 4: run defect model on Step 3 bbox crops ----
-    def _run_step4_defect(self, step2_dir):
-        from pathlib import Path as _Path
-        import re as _re
-        import cv2 as _cv2
-        import numpy as _np
-        from services.config import state as _state
-        from services import solvision_manager
-
-        step2_dir = _Path(step2_dir)
+    def _run_step4_defect(self, step2_dir, crops=None):
+        step2_dir = Path(step2_dir)
         step3_dir = step2_dir.parent / 'step-03'
         step4_dir = step2_dir.parent / 'step-04'
-        bbox_files = sorted(step3_dir.glob('step-03_front_bbox_*.png'))
-        if not bbox_files:
+        jobs = _indexed_pngs(step3_dir, 'step-03_front_bbox_')
+        if not jobs:
             self.tt_message.emit("[Step4] No Step-03 bbox crops found; skipping.")
             return
 
-        from services.config import state as _state
-        st = _state()
+        st = state()
         defect_thr = getattr(st, 'defect_score_threshold', None)
+        # Empty results get no "No defects" PNG unless the user asked for them
+        emit_empty = bool(getattr(st, "emit_empty_annotations", None))
+        decode_reduce = getattr(st, "defect_decode_reduce", None)
         defect_loaded_path = solvision_manager.current_project_path_for('defect')
         if not defect_loaded_path:
             self.tt_message.emit("[Step4] Defect model not loaded; please load it before running Step 4.")
@@ -2408,100 +2726,97 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        def _hex_to_bgr(hs):
-            try:
-                hs = str(hs).lstrip("#").strip()
-                if len(hs) == 6:
-                    r = int(hs[0:2], 16); g = int(hs[2:4], 16); b = int(hs[4:6], 16)
-                    return (b, g, r)
-            except Exception:
-                pass
-            return None
-
-        # Precompute palette from defect model metadata only (no fallbacks).
-        palette_bgr = []
-        try:
-            cols = solvision_manager.class_colors_for('defect')
-            if cols:
-                for hs in cols:
-                    c = _hex_to_bgr(hs)
-                    if c is not None:
-                        palette_bgr.append(c)
-        except Exception:
-            palette_bgr = []
+        # Precompute palette from defect model metadata only (no fallbacks). Kept positional so
+        # class_id indexes it directly (det['color'] is the same class_colors entry).
+        palette_bgr = self._class_palette('defect')
+        no_defect_color = next((c for c in palette_bgr if c is not None), None)
 
         def _color_for_det(det_obj):
-            # Prefer the exact color coming from Detectron metadata; otherwise map by class id if available.
-            c = _hex_to_bgr(det_obj.get('color'))
-            if c is not None:
-                return c
-            try:
-                cid = det_obj.get("class_id")
-                if palette_bgr and cid is not None and 0 <= int(cid) < len(palette_bgr):
-                    return palette_bgr[int(cid)]
-            except Exception:
-                pass
+            cid = det_obj.get("class_id")
+            if isinstance(cid, _REAL_TYPES) and 0 <= int(cid) < len(palette_bgr):
+                return palette_bgr[int(cid)]
             return None
 
-        rx = _re.compile(r"step-03_front_bbox_(\d+)\.png$", _re.IGNORECASE)
-        total = 0
-        for p in bbox_files:
-            m = rx.search(p.name)
-            if not m:
-                continue
-            idx = int(m.group(1))
+        def _read_one(job):
+            idx, p = job
+            # Bbox crops handed over from Step 3 skip the PNG decode
+            src = crops[idx] if crops is not None and idx in crops else p
             try:
-                img = _cv2.imread(str(p))
+                model_img = _read_defect_input(src, decode_reduce)
+            except Exception:
+                model_img = None
+            if model_img is None:
+                self.tt_message.emit(f"[Step4] idx {idx}: failed to read {p}")
+                return None
+            return idx, src, model_img
+
+        def _annotate_one(item):
+            (idx, src, model_img), dets = item
+            if dets is None:
+                return 0
+            if not dets and not emit_empty:
+                # Re-runs reuse the folder; drop a result left over from an earlier run
+                try:
+                    os.remove(step4_dir / f"step-04_defect_{idx:03d}.png")
+                except OSError:
+                    pass
+                self.tt_message.emit(f"[Step4] idx {idx}: no defects (skipped)")
+                return 1
+            try:
+                # Step 3's in-memory crops are private copies, so they are drawn on directly
+                img = _full_size_crop(src, model_img, decode_reduce)
                 if img is None:
-                    self.tt_message.emit(f"[Step4] idx {idx}: failed to read {p}")
-                    continue
-                H, W = img.shape[:2]
-                dets = solvision_manager.detect_for('defect', str(p), score_threshold=defect_thr)
-                ann = img.copy()
+                    self.tt_message.emit(f"[Step4] idx {idx}: failed to read {src}")
+                    return 0
+                dets = _scale_detections(dets, img.shape[1] / model_img.shape[1], img.shape[0] / model_img.shape[0])
                 if not dets:
-                    if palette_bgr:
-                        _cv2.putText(ann, 'No defects', (20, 40), _cv2.FONT_HERSHEY_SIMPLEX, 1.0, palette_bgr[0], 2)
+                    if no_defect_color is not None:
+                        cv2.putText(img, 'No defects', (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, no_defect_color, 2)
                 else:
-                    def _label_pos(x, y, w, h, text):
-                        # Keep text fully inside image: clamp horizontally and flip below when needed.
-                        (tw, th), _ = _cv2.getTextSize(text, _cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
-                        lx = max(0, min(W - tw - 1, x + 4))
-                        if y - th - 6 >= 0:
-                            ly = y - 6
-                        else:
-                            ly = min(H - 6, y + h + th)
-                        ly = max(th, min(H - 1, ly))
-                        return lx, ly
-                    for det in dets:
-                        b = det.get('bounds')
-                        if not b or len(b) < 4:
-                            continue
-                        x, y, w, h = b
-                        try:
-                            x = int(round(float(x))); y = int(round(float(y)))
-                            w = int(round(float(w))); h = int(round(float(h)))
-                        except Exception:
-                            continue
-                        color = _color_for_det(det)
-                        if color is None:
-                            continue
-                        _cv2.rectangle(ann, (x, y), (x + w, y + h), color, 2)
-                        label = str(det.get('class') or 'defect')
-                        try:
-                            sc = det.get('score')
-                            if sc is not None:
-                                label = f"{label} {float(sc):.2f}"
-                        except Exception:
-                            pass
-                        if label:
-                            lx, ly = _label_pos(x, y, w, h, label)
-                            _cv2.putText(ann, label, (lx, ly), _cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                    _draw_detections(img, dets, _color_for_det)
                 out_ann = str(step4_dir / f"step-04_defect_{idx:03d}.png")
-                _cv2.imwrite(out_ann, ann)
-                self.tt_message.emit(f"[Step4] idx {idx}: saved {out_ann}")
-                total += 1
+                res = _imwrite_if_changed(out_ann, img, _STEP_IMG_PARAMS, skip_unchanged=True)
+                if res == "failed":
+                    self.tt_message.emit(f"[Step4] idx {idx}: save failed: {out_ann}: encode error")
+                    return 0
+                if res == "unchanged":
+                    self.tt_message.emit(f"[Step4] idx {idx}: unchanged {out_ann}")
+                else:
+                    self.tt_message.emit(f"[Step4] idx {idx}: saved {out_ann}")
+                return 1
             except Exception as ex:
                 self.tt_message.emit(f"[Step4] idx {idx}: failed: {ex}")
+                return 0
+
+        # Decode and annotate/write are per-crop and run on a pool; inference stays batched and
+        # serialized by detect_batch_for. Reads run ahead and each batch's writes are queued as
+        # soon as its detections are back, so disk I/O overlaps the next forward pass.
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4, max(1, len(jobs))))
+        try:
+            reads = [pool.submit(_read_one, job) for job in jobs]
+            writes = []
+            batch_size = 8
+            for start in range(0, len(reads), batch_size):
+                chunk = [f.result() for f in reads[start:start + batch_size]]
+                chunk = [it for it in chunk if it is not None]
+                if not chunk:
+                    continue
+                try:
+                    det_lists = solvision_manager.detect_batch_for('defect', [it[2] for it in chunk], score_threshold=defect_thr)
+                except Exception as ex:
+                    # Retry the crops one by one so a single bad input cannot drop the whole batch
+                    self.tt_message.emit(f"[Step4] Batch detect failed: {ex}; retrying per crop")
+                    det_lists = []
+                    for idx, _src, model_img in chunk:
+                        try:
+                            det_lists.append(solvision_manager.detect_for('defect', model_img, score_threshold=defect_thr))
+                        except Exception as ex_one:
+                            self.tt_message.emit(f"[Step4] idx {idx}: detect failed: {ex_one}")
+                            det_lists.append(None)
+                writes.extend(pool.submit(_annotate_one, item) for item in zip(chunk, det_lists))
+            total = sum(f.result() for f in writes)
+        finally:
+            pool.shutdown(wait=False)
         self.tt_message.emit(f"[Step4] Done. Processed {total} bbox crop(s)")
 
     # Camera slots
@@ -2509,6 +2824,10 @@ class MainWindow(QMainWindow):
         try:
             devices = camera_service.enumerate_devices()
             self.workflow_tab.camera_panel.set_devices(devices)
+            # Same text the selectors show, keyed by device index
+            self._device_name_map = {
+                d.get("index"): d.get("name", f"Camera {d.get('index','?')}") for d in devices
+            }
             backend = camera_service.backend_name()
             self.workflow_tab.append_log(f"[Camera] Backend(s): {backend} | Found {len(devices)} device(s).")
             if len(devices) == 0:
@@ -2528,13 +2847,8 @@ class MainWindow(QMainWindow):
             self.workflow_tab.append_log(f"[Camera] Enumeration failed: {ex}")
 
     def _device_name(self, index: int) -> str:
-        # Find name from the current panel list
-        for widget in (self.workflow_tab.camera_panel.top, self.workflow_tab.camera_panel.front):
-            for i in range(widget.selector.count()):
-                data = widget.selector.itemData(i)
-                if isinstance(data, dict) and data.get("index") == index:
-                    return widget.selector.itemText(i)
-        return f"Camera {index}"
+        # Name from the last device enumeration (see on_camera_refresh)
+        return self._device_name_map.get(index, f"Camera {index}")
 
     def on_camera_connect(self, role: str, index: int):
         # prevent same device for both roles
@@ -2601,6 +2915,9 @@ class MainWindow(QMainWindow):
             self._live_inflight["Front"] = None
         except Exception:
             pass
+        with self._live_pending_lock:
+            self._live_pending["Top"] = None
+            self._live_pending["Front"] = None
 
     def _stop_live_if_idle(self):
         try:
@@ -2622,6 +2939,11 @@ class MainWindow(QMainWindow):
         def _schedule(role: str):
             if not camera_service.is_connected(role):
                 return
+            # Widget sizes are read here on the GUI thread; the worker only gets the numbers
+            try:
+                target = self.preview_panel.preview_target_size(role)
+            except Exception:
+                target = None
             fut = self._live_inflight.get(role)
             if fut is not None and not fut.done():
                 return
@@ -2629,7 +2951,7 @@ class MainWindow(QMainWindow):
             fut = self._live_executor.submit(cammgr.capture_live, role)
             self._live_inflight[role] = fut
 
-            def _done(_fut, role_inner=role, gen_inner=gen):
+            def _done(_fut, role_inner=role, gen_inner=gen, target_inner=target):
                 try:
                     self._live_inflight[role_inner] = None
                 except Exception:
@@ -2652,10 +2974,39 @@ class MainWindow(QMainWindow):
 
                 if frame is None:
                     return
+                # Drivers re-deliver the same frame on a static scene; skip the resize/convert only
+                # when the whole buffer is byte-identical to the last one shown for this role (and
+                # neither the generation nor the preview size changed).
+                last = self._live_last_frame.get(role_inner)
+                if (last is not None and last[0] == gen_inner and last[1] == target_inner
+                        and last[2].shape == frame.shape and np.array_equal(last[2], frame)):
+                    return
+                self._live_last_frame[role_inner] = (gen_inner, target_inner, frame)
+                # Shrink to the size the preview will show (cover fit) and build the QImage here,
+                # off the GUI thread; overlays keep using full-frame coordinates via source_size.
+                src_size = None
                 try:
-                    self.live_frame_ready.emit(role_inner, int(gen_inner), frame)
+                    if target_inner is not None:
+                        tw, th = target_inner
+                        fh, fw = frame.shape[:2]
+                        scale = max(tw / fw, th / fh)
+                        if scale < 1.0:
+                            frame = cv2.resize(frame, (max(1, round(fw * scale)), max(1, round(fh * scale))),
+                                               interpolation=cv2.INTER_AREA)
+                            src_size = (fw, fh)
+                    qimg = np_bgr_to_qimage(frame)
                 except Exception:
-                    pass
+                    qimg = None
+                if qimg is None or qimg.isNull():
+                    return
+                with self._live_pending_lock:
+                    notify = self._live_pending.get(role_inner) is None
+                    self._live_pending[role_inner] = (int(gen_inner), qimg, src_size)
+                if notify:
+                    try:
+                        self.live_frame_ready.emit(role_inner, int(gen_inner), None)
+                    except Exception:
+                        pass
 
             try:
                 fut.add_done_callback(_done)
@@ -2703,8 +3054,6 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        import threading
-
         def _load():
             from PyQt5.QtCore import QTimer
             try:
@@ -2736,7 +3085,7 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
 
-        threading.Thread(target=_load, daemon=True).start()
+        self._loader_pool.submit(_load)
 
     def on_load_front_file(self, path: str):
         if not path:
@@ -2751,15 +3100,15 @@ class MainWindow(QMainWindow):
             self.workflow_tab.append_log(f"[Detectron] Front model set: {path}")
             # Preload into its own session asynchronously to avoid blocking the UI
             try:
-                import threading
                 from services import solvision_manager
                 def _load():
                     try:
                         solvision_manager.load_project_for('front', path, mode='exe')
+                        self._class_palettes.pop('front', None)
                         self.tt_message.emit("[Detectron] Front model loaded in dedicated session.")
                     except Exception as ex:
                         self.tt_message.emit(f"[Detectron] Front model load failed: {ex}")
-                threading.Thread(target=_load, daemon=True).start()
+                self._loader_pool.submit(_load)
             except Exception:
                 pass
         except Exception:
@@ -2778,15 +3127,16 @@ class MainWindow(QMainWindow):
             self.workflow_tab.append_log(f"[Detectron] Defect model set: {path}")
             # Preload defect model in its own session asynchronously
             try:
-                import threading
                 from services import solvision_manager
                 def _load():
                     try:
                         solvision_manager.load_project_for('defect', path, mode='exe')
+                        self._defect_palette_bgr = None  # class colors come from the new model
+                        self._class_palettes.pop('defect', None)
                         self.tt_message.emit("[Detectron] Defect model loaded in dedicated session.")
                     except Exception as ex:
                         self.tt_message.emit(f"[Detectron] Defect model load failed: {ex}")
-                threading.Thread(target=_load, daemon=True).start()
+                self._loader_pool.submit(_load)
             except Exception:
                 pass
         except Exception:
@@ -2794,6 +3144,10 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         try:
+            try:
+                self.workflow_tab.flush_pending_saves()
+            except Exception:
+                pass
             try:
                 self._shutdown_live_feed()
             except Exception:
@@ -2806,6 +3160,11 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             plc_service.disconnect()
+            for pool in (self._loader_pool, self._hw_exec):
+                try:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                except Exception:
+                    pass
             try:
                 solvision_manager.dispose()
             except Exception:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, QSignalBlocker
 from PyQt5.QtWidgets import (
     QWidget,
     QGroupBox,
@@ -11,6 +11,8 @@ from PyQt5.QtWidgets import (
     QLabel,
 )
 
+from .styles import set_button_state
+
 
 class PlcPanel(QWidget):
     refresh_requested = pyqtSignal()
@@ -52,11 +54,13 @@ class PlcPanel(QWidget):
             self.connect_requested.emit(host)
 
     def set_hosts(self, hosts):
-        self.host_combo.blockSignals(True)
-        self.host_combo.clear()
-        for h in hosts or []:
-            self.host_combo.addItem(str(h))
-        self.host_combo.blockSignals(False)
+        blocker = QSignalBlocker(self.host_combo)
+        try:
+            self.host_combo.clear()
+            for h in hosts or []:
+                self.host_combo.addItem(str(h))
+        finally:
+            blocker.unblock()
 
     def set_connected(self, connected: bool, endpoint: str = ""):
         self._connected = bool(connected)
@@ -68,20 +72,5 @@ class PlcPanel(QWidget):
         self.status.setText(text or "")
 
     def _apply_connect_style(self, connected: bool):
-        if connected:
-            self.bt_connect.setStyleSheet(
-                "QPushButton {"
-                " background-color: #2e7d32; color: white;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: #388e3c; }"
-            )
-        else:
-            self.bt_connect.setStyleSheet(
-                "QPushButton {"
-                " background: transparent; color: #2e7d32;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: rgba(46,125,50,0.08); }"
-            )
+        set_button_state(self.bt_connect, "active" if connected else "idle")
 
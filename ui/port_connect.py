@@ -0,0 +1,30 @@
+from typing import Optional
+
+
+def endpoint_host(text: Optional[str]) -> str:
+    """Host part of a combo entry ("host", "host:port") or a PLC endpoint ("host:502 (unit 255)")."""
+    return str(text or "").strip().split(" ", 1)[0].split(":", 1)[0].strip().lower()
+
+
+class PortConnectMixin:
+    """Connect button handling shared by the PLC-backed panels.
+
+    The panel provides port_combo, connect_requested and set_status, and calls
+    _track_connected_port from its set_connected.
+    """
+
+    _connected = False
+    _connected_port: Optional[str] = None
+
+    def _on_connect(self):
+        port = self.port_combo.currentText().strip()
+        if not port:
+            return
+        # A second click on Reconnect for the endpoint that is already up would only tear down a working link
+        if self._connected and endpoint_host(port) == self._connected_port:
+            self.set_status(f"Already connected ({port}).")
+            return
+        self.connect_requested.emit(port)
+
+    def _track_connected_port(self, connected: bool, port: Optional[str]):
+        self._connected_port = (endpoint_host(port) or None) if connected else None
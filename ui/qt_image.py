@@ -1,21 +1,48 @@
-from typing import Optional
+from typing import Optional, Tuple
+import threading
 import numpy as np
 from PyQt5.QtGui import QImage, QPixmap
 
+_HAS_BGR888 = hasattr(QImage, "Format_BGR888")
+# Per-thread RGB scratch buffers for the Qt < 5.14 path, keyed by (h, w)
+_rgb_scratch = threading.local()
 
-def np_bgr_to_qpixmap(arr: np.ndarray) -> Optional[QPixmap]:
+
+def _rgb_buffer(h: int, w: int) -> np.ndarray:
+    bufs = getattr(_rgb_scratch, "bufs", None)
+    if bufs is None:
+        bufs = _rgb_scratch.bufs = {}
+    buf = bufs.get((h, w))
+    if buf is None:
+        buf = bufs[(h, w)] = np.empty((h, w, 3), np.uint8)
+    return buf
+
+
+def _wrap_bgr(arr) -> Optional[Tuple[QImage, np.ndarray]]:
+    """QImage viewing a BGR/mono frame, plus the array backing it (keep it alive while the image is used)."""
     if arr is None:
         return None
+    # Live frames are contiguous (H, W, 3) uint8; wrap them before any of the generic shape/dtype probing.
+    if (_HAS_BGR888 and type(arr) is np.ndarray and arr.dtype == np.uint8 and arr.ndim == 3
+            and arr.shape[2] == 3 and arr.flags.c_contiguous):
+        h, w = arr.shape[:2]
+        return QImage(arr.data, w, h, int(arr.strides[0]), QImage.Format_BGR888), arr
     try:
         a = np.asarray(arr)
     except Exception:
         return None
 
+    if a.ndim == 3 and a.shape[2] == 1:
+        a = a[:, :, 0]
+    if a.ndim == 2 and a.dtype == np.uint8:
+        # Mono frames: wrap as Grayscale8 instead of building a 3x larger BGR buffer per frame
+        gray = np.ascontiguousarray(a)
+        h, w = gray.shape
+        return QImage(gray.data, w, h, int(gray.strides[0]), QImage.Format_Grayscale8), gray
+
     # Normalize to 3-channel BGR uint8.
     if a.ndim == 2:
         a = np.repeat(a[:, :, None], 3, axis=2)
-    elif a.ndim == 3 and a.shape[2] == 1:
-        a = np.repeat(a, 3, axis=2)
     elif a.ndim == 3 and a.shape[2] >= 3:
         a = a[:, :, :3]
     else:
@@ -28,9 +55,39 @@ def np_bgr_to_qpixmap(arr: np.ndarray) -> Optional[QPixmap]:
             return None
 
     bgr = np.ascontiguousarray(a)
-    rgb = bgr[:, :, ::-1].copy()  # ensure contiguous and decoupled from source
-    h, w = rgb.shape[:2]
-    bytes_per_line = int(rgb.strides[0])
-    # Copy the QImage so it doesn't reference a temporary numpy buffer.
-    qimg = QImage(rgb.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
+    if _HAS_BGR888:
+        # Wrap the BGR buffer directly (Qt >= 5.14); no swap or extra copy is needed.
+        h, w = bgr.shape[:2]
+        return QImage(bgr.data, w, h, int(bgr.strides[0]), QImage.Format_BGR888), bgr
+
+    # Qt < 5.14: swap channels with three per-channel assignments, each one long row-wise
+    # copy loop (the reversed-view copy ran a 3-element loop per pixel). The buffer is
+    # reused per resolution; both callers copy out of the QImage before returning.
+    h, w = bgr.shape[:2]
+    rgb = _rgb_buffer(h, w)
+    np.copyto(rgb[:, :, 0], bgr[:, :, 2])
+    np.copyto(rgb[:, :, 1], bgr[:, :, 1])
+    np.copyto(rgb[:, :, 2], bgr[:, :, 0])
+    return QImage(rgb.data, w, h, int(rgb.strides[0]), QImage.Format_RGB888), rgb
+
+
+def np_bgr_to_qpixmap(arr: np.ndarray) -> Optional[QPixmap]:
+    wrapped = _wrap_bgr(arr)
+    if wrapped is None:
+        return None
+    # fromImage() copies into the pixmap while the backing array is still referenced
+    qimg, _buf = wrapped
     return QPixmap.fromImage(qimg)
+
+
+def np_bgr_to_qimage(arr: np.ndarray) -> Optional[QImage]:
+    """Detached RGB32 QImage for arr; safe to build off the GUI thread.
+
+    RGB32 is the raster pixmap format, so the later QPixmap.fromImage() on the
+    GUI thread is a plain copy with no per-pixel conversion.
+    """
+    wrapped = _wrap_bgr(arr)
+    if wrapped is None:
+        return None
+    qimg, _buf = wrapped
+    return qimg.convertToFormat(QImage.Format_RGB32)
@@ -0,0 +1,26 @@
+from PyQt5.QtWidgets import QPushButton
+
+# Application-wide stylesheet, set once on the QApplication. Buttons pick a look through
+# their "state" property, so toggling one never re-parses CSS.
+APP_QSS = (
+    'QPushButton[state="active"], QPushButton[state="busy"], QPushButton[state="idle"] {'
+    " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
+    "}"
+    'QPushButton[state="active"] { background-color: #2e7d32; color: white; }'
+    'QPushButton[state="active"]:hover { background-color: #388e3c; }'
+    'QPushButton[state="idle"] { background: transparent; color: #2e7d32; }'
+    'QPushButton[state="idle"]:hover { background-color: rgba(46,125,50,0.08); }'
+    'QPushButton[state="busy"] { background-color: #c62828; color: white; border-color: #c62828; }'
+    'QPushButton[state="busy"]:hover { background-color: #d32f2f; }'
+)
+
+
+def set_button_state(btn: QPushButton, state: str) -> None:
+    """Switch btn to the "active", "idle" or "busy" look; no-op when unchanged."""
+    if btn.property("state") == state:
+        return
+    btn.setProperty("state", state)
+    # Property selectors are only re-evaluated on polish
+    style = btn.style()
+    style.unpolish(btn)
+    style.polish(btn)
@@ -1,4 +1,6 @@
-from PyQt5.QtCore import pyqtSignal
+import re
+
+from PyQt5.QtCore import pyqtSignal, QSignalBlocker
 from PyQt5.QtWidgets import (
     QWidget,
     QGroupBox,
@@ -10,8 +12,20 @@ from PyQt5.QtWidgets import (
     QDoubleSpinBox,
 )
 
+from .port_connect import PortConnectMixin
+from .styles import set_button_state
+
+_SCI_RE = re.compile(r"[-+]?\d*\.?\d+[eE][-+]?\d+")
+
+
+def _fixed_decimals(m):
+    try:
+        return f"{float(m.group(0)):.2f}"
+    except Exception:
+        return m.group(0)
 
-class TurntablePanel(QWidget):
+
+class TurntablePanel(PortConnectMixin, QWidget):
     refresh_requested = pyqtSignal()
     connect_requested = pyqtSignal(str)
     home_requested = pyqtSignal()
@@ -21,6 +35,7 @@ class TurntablePanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._port_index = {}
         group = QGroupBox("Step 3 - Prepare Turntable")
         root = QVBoxLayout(self)
         root.addWidget(group)
@@ -30,7 +45,7 @@ class TurntablePanel(QWidget):
         row = QHBoxLayout()
         self.port_combo = QComboBox()
         self.port_combo.setEditable(True)
-        self.port_combo.currentTextChanged.connect(lambda s: self.port_selected.emit(s))
+        self.port_combo.currentTextChanged.connect(self.port_selected)
         row.addWidget(self.port_combo, stretch=1)
 
         self.bt_refresh = QPushButton("Refresh")
@@ -54,15 +69,16 @@ class TurntablePanel(QWidget):
         self.step.setDecimals(2)
         self.step.setRange(-3600.0, 3600.0)
         self.step.setSingleStep(5.0)
+        self.step.setKeyboardTracking(False)
         self.step.setValue(45.0)
-        self.step.valueChanged.connect(lambda v: self.step_changed.emit(float(v)))
+        self.step.valueChanged.connect(self.step_changed)
         rot_row.addWidget(QLabel("Step (deg):"))
         rot_row.addWidget(self.step)
         self.bt_ccw = QPushButton("Rotate -")
-        self.bt_ccw.clicked.connect(lambda: self.rotate_requested.emit(-abs(self.step.value())))
+        self.bt_ccw.clicked.connect(self._on_rotate_ccw)
         rot_row.addWidget(self.bt_ccw)
         self.bt_cw = QPushButton("Rotate +")
-        self.bt_cw.clicked.connect(lambda: self.rotate_requested.emit(abs(self.step.value())))
+        self.bt_cw.clicked.connect(self._on_rotate_cw)
         rot_row.addWidget(self.bt_cw)
         v.addLayout(rot_row)
 
@@ -70,21 +86,44 @@ class TurntablePanel(QWidget):
         v.addWidget(self.status)
 
         self._connected = False
+        self._connected_port = None
+
+    def _on_rotate_ccw(self):
+        self.rotate_requested.emit(-abs(self.step.value()))
 
-    def _on_connect(self):
-        port = self.port_combo.currentText().strip()
-        if port:
-            self.connect_requested.emit(port)
+    def _on_rotate_cw(self):
+        self.rotate_requested.emit(abs(self.step.value()))
 
     def set_ports(self, ports):
-        self.port_combo.blockSignals(True)
-        self.port_combo.clear()
-        for p in ports:
-            self.port_combo.addItem(p)
-        self.port_combo.blockSignals(False)
+        blocker = QSignalBlocker(self.port_combo)
+        try:
+            self.port_combo.clear()
+            names = [str(p) for p in ports]
+            self.port_combo.addItems(names)
+            self._port_index = {}
+            for i, name in enumerate(names):
+                self._port_index.setdefault(name, i)
+        finally:
+            blocker.unblock()
+
+    def select_host(self, host: str) -> bool:
+        # Programmatic restore: no port_selected, so the saved host is not written back
+        idx = self._port_index.get(host)
+        if idx is None:
+            # Typed-in entries are not in the map
+            idx = self.port_combo.findText(host)
+        if idx < 0:
+            return False
+        blocker = QSignalBlocker(self.port_combo)
+        try:
+            self.port_combo.setCurrentIndex(idx)
+        finally:
+            blocker.unblock()
+        return True
 
     def set_connected(self, connected: bool, port: str = None):
         self._connected = connected
+        self._track_connected_port(connected, port)
         self.port_combo.setEnabled(not connected)
         self.bt_refresh.setEnabled(not connected)
         self.bt_connect.setText("Reconnect" if connected else "Connect")
@@ -100,29 +139,10 @@ class TurntablePanel(QWidget):
 
     def set_status(self, text: str):
         # Convert any scientific notation numbers to fixed decimals for readability
-        import re
-        def repl(m):
-            try:
-                return f"{float(m.group(0)):.2f}"
-            except Exception:
-                return m.group(0)
-        cleaned = re.sub(r"[-+]?\d*\.?\d+[eE][-+]?\d+", repl, text or "")
-        self.status.setText(cleaned)
+        text = text or ""
+        if "e" in text or "E" in text:
+            text = _SCI_RE.sub(_fixed_decimals, text)
+        self.status.setText(text)
 
     def _apply_connect_style(self, connected: bool):
-        if connected:
-            self.bt_connect.setStyleSheet(
-                "QPushButton {"
-                " background-color: #2e7d32; color: white;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: #388e3c; }"
-            )
-        else:
-            self.bt_connect.setStyleSheet(
-                "QPushButton {"
-                " background: transparent; color: #2e7d32;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: rgba(46,125,50,0.08); }"
-            )
+        set_button_state(self.bt_connect, "active" if connected else "idle")
@@ -5,20 +5,81 @@ from PyQt5.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QPushButton,
-    QTextEdit,
     QPlainTextEdit,
     QScrollArea,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
     QSpinBox,
     QLineEdit,
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex
+import threading
 from services.config import state as _state, save_state as _save_state
 from .camera_panel import CameraPanel
 from .turntable_panel import TurntablePanel
 from .linear_axis_panel import LinearAxisPanel
+from .styles import set_button_state
+
+
+class _DetectionResultsModel(QAbstractTableModel):
+    HEADERS = (
+        "#",
+        "Class",
+        "Score",
+        "Angle (deg)",
+        "Phi (rad)",
+        "Center (x,y)",
+        "Bounds (x,y,w,h)",
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # Cell strings per row, formatted the first time the row is painted
+        self._cells = []
+
+    def set_detections(self, rows):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._cells = [None] * len(self._rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        cells = self._cells[row]
+        if cells is None:
+            cells = self._cells[row] = self._format_row(self._rows[row])
+        return cells[index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    @staticmethod
+    def _format_row(det):
+        idx_val = det.get("index")
+        phi = det.get("phi")
+        # Prefer bbox center if available; fallback to image center
+        ctr = det.get("det_center", det.get("center", ""))
+        return (
+            str(idx_val if idx_val is not None else ""),
+            str(det.get("class", "")),
+            f"{det.get('score', '')}",
+            f"{det.get('angle', '')}",
+            (f"{phi:.3f}" if isinstance(phi, (int, float)) else ""),
+            str(ctr),
+            str(det.get("bounds", "")),
+        )
 
 
 class WorkflowTab(QWidget):
@@ -30,9 +91,15 @@ class WorkflowTab(QWidget):
     load_defect_requested = pyqtSignal(str)
     run_step3_step4_requested = pyqtSignal()
     defect_threshold_changed = pyqtSignal(float)
+    _log_flush_requested = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Saved values for the initial widget contents, read once
+        try:
+            st_init = _state()
+        except Exception:
+            st_init = None
 
         # Scrollable container to match WinForms AutoScroll panel
         scroll = QScrollArea()
@@ -51,9 +118,7 @@ class WorkflowTab(QWidget):
         def file_row(label_text: str):
             row = QHBoxLayout()
             label = QLabel(label_text)
-            edit = QTextEdit()
-            edit.setFixedHeight(30)
-            edit.setAcceptRichText(False)
+            edit = QLineEdit()
             btn = QPushButton("Load")
             self._apply_primary_style(btn, active=False)
             row.addWidget(label)
@@ -70,9 +135,9 @@ class WorkflowTab(QWidget):
         layout.addWidget(self.group_files)
 
         # Wire load buttons to main window
-        self.bt_attach_load.clicked.connect(lambda: self.load_attachment_requested.emit(self.edit_attach.toPlainText().strip()))
-        self.bt_front_load.clicked.connect(lambda: self.load_front_requested.emit(self.edit_front.toPlainText().strip()))
-        self.bt_defect_load.clicked.connect(lambda: self.load_defect_requested.emit(self.edit_defect.toPlainText().strip()))
+        self.bt_attach_load.clicked.connect(self._on_attach_load)
+        self.bt_front_load.clicked.connect(self._on_front_load)
+        self.bt_defect_load.clicked.connect(self._on_defect_load)
 
         # Optional: Upload Image section (hidden by default)
         self.group_step2 = QGroupBox("Step 2 - Upload Image")
@@ -103,12 +168,17 @@ class WorkflowTab(QWidget):
         pid_label = QLabel("Part ID:")
         self.edit_part_id = QLineEdit()
         try:
-            self.edit_part_id.setText(str(getattr(_state(), 'part_id', '') or ''))
+            self.edit_part_id.setText(str(getattr(st_init, 'part_id', '') or ''))
         except Exception:
             pass
         pid_row.addWidget(pid_label)
         pid_row.addWidget(self.edit_part_id, 1)
         detect_layout.addLayout(pid_row)
+        # Banner shown while detection is gated on a saved tuner calibration
+        self.lbl_detect_banner = QLabel("Calibrate tuner to enable detection")
+        self.lbl_detect_banner.setStyleSheet("color: #c62828; font-weight: 600;")
+        self.lbl_detect_banner.setVisible(False)
+        detect_layout.addWidget(self.lbl_detect_banner)
         self.bt_detect = QPushButton("Run Detection")
         self.bt_detect.clicked.connect(self.run_detection_requested.emit)
         detect_layout.addWidget(self.bt_detect)
@@ -124,9 +194,10 @@ class WorkflowTab(QWidget):
         self.spin_defect_thr.setDecimals(3)
         self.spin_defect_thr.setRange(0.0, 1.0)
         self.spin_defect_thr.setSingleStep(0.01)
+        # Spinboxes here commit on Enter/focus-out/arrows, not on every typed digit
+        self.spin_defect_thr.setKeyboardTracking(False)
         try:
-            st_thr = _state()
-            val = float(getattr(st_thr, "defect_score_threshold", None))
+            val = float(getattr(st_init, "defect_score_threshold", None))
             if val is None:
                 raise ValueError()
         except Exception:
@@ -138,10 +209,10 @@ class WorkflowTab(QWidget):
         def _persist_defect_thr(v):
             try:
                 st = _state()
-                st.defect_score_threshold = float(v)
+                st.defect_score_threshold = v
                 _save_state()
-                self.append_log(f"[Step4] Defect threshold set to {float(v):.3f}")
-                self.defect_threshold_changed.emit(float(v))
+                self.append_log(f"[Step4] Defect threshold set to {v:.3f}")
+                self.defect_threshold_changed.emit(v)
             except Exception:
                 pass
 
@@ -158,9 +229,9 @@ class WorkflowTab(QWidget):
         crop_label = QLabel("Square crop size (px):")
         self.crop_size = QSpinBox()
         self.crop_size.setRange(100, 8192)
+        self.crop_size.setKeyboardTracking(False)
         try:
-            st0 = _state()
-            default_cs = int(getattr(st0, 'step2_crop_size', None) or 1600)
+            default_cs = int(getattr(st_init, 'step2_crop_size', None) or 1600)
         except Exception:
             default_cs = 1600
         self.crop_size.setValue(default_cs)
@@ -171,8 +242,8 @@ class WorkflowTab(QWidget):
         # Persist crop size on change
         def _on_crop_changed(v):
             try:
-                st = _state(); st.step2_crop_size = int(v); _save_state()
-                self.append_log(f"[Step2] Crop size set to {int(v)} px")
+                st = _state(); st.step2_crop_size = v; _save_state()
+                self.append_log(f"[Step2] Crop size set to {v} px")
             except Exception:
                 pass
         self.crop_size.valueChanged.connect(_on_crop_changed)
@@ -181,31 +252,34 @@ class WorkflowTab(QWidget):
         self.group_light = QGroupBox("Light Controller")
         light_layout = QHBoxLayout(self.group_light)
         light_layout.addWidget(QLabel("IP:"))
-        self.edit_light_ip = QTextEdit(); self.edit_light_ip.setFixedHeight(28); self.edit_light_ip.setAcceptRichText(False)
+        self.edit_light_ip = QLineEdit()
         try:
-            self.edit_light_ip.setPlainText(str(getattr(_state(), 'light_ip', '') or ''))
+            self.edit_light_ip.setText(str(getattr(st_init, 'light_ip', '') or ''))
         except Exception:
             pass
         light_layout.addWidget(self.edit_light_ip, 1)
         light_layout.addWidget(QLabel("Top (mA):"))
         self.spin_top_ma = QSpinBox(); self.spin_top_ma.setRange(0, 250); self.spin_top_ma.setSingleStep(5)
+        self.spin_top_ma.setKeyboardTracking(False)
         try:
-            self.spin_top_ma.setValue(int(getattr(_state(), 'top_current_ma', 0) or 0))
+            self.spin_top_ma.setValue(int(getattr(st_init, 'top_current_ma', 0) or 0))
         except Exception:
             self.spin_top_ma.setValue(0)
         light_layout.addWidget(self.spin_top_ma)
         light_layout.addWidget(QLabel("Front (mA):"))
         self.spin_front_ma = QSpinBox(); self.spin_front_ma.setRange(0, 250); self.spin_front_ma.setSingleStep(5)
+        self.spin_front_ma.setKeyboardTracking(False)
         try:
-            self.spin_front_ma.setValue(int(getattr(_state(), 'front_current_ma', 0) or 0))
+            self.spin_front_ma.setValue(int(getattr(st_init, 'front_current_ma', 0) or 0))
         except Exception:
             self.spin_front_ma.setValue(0)
         light_layout.addWidget(self.spin_front_ma)
         # Dwell (ms) setting; when brightness changes, capture waits this long
         light_layout.addWidget(QLabel("Dwell (ms):"))
         self.spin_dwell = QSpinBox(); self.spin_dwell.setRange(0, 2000); self.spin_dwell.setSingleStep(10)
+        self.spin_dwell.setKeyboardTracking(False)
         try:
-            self.spin_dwell.setValue(int(getattr(_state(), 'light_dwell_ms', 60) or 60))
+            self.spin_dwell.setValue(int(getattr(st_init, 'light_dwell_ms', 60) or 60))
         except Exception:
             self.spin_dwell.setValue(60)
         light_layout.addWidget(self.spin_dwell)
@@ -214,20 +288,32 @@ class WorkflowTab(QWidget):
         def _persist_light():
             try:
                 st = _state()
-                st.light_ip = self.edit_light_ip.toPlainText().strip()
-                st.top_current_ma = int(self.spin_top_ma.value())
-                st.front_current_ma = int(self.spin_front_ma.value())
-                st.light_dwell_ms = int(self.spin_dwell.value())
+                vals = (self.edit_light_ip.text().strip(), self.spin_top_ma.value(),
+                        self.spin_front_ma.value(), self.spin_dwell.value())
+                # A burst that ends where it started (or a flush with nothing new) writes nothing
+                if vals == (st.light_ip, st.top_current_ma, st.front_current_ma, st.light_dwell_ms):
+                    return
+                st.light_ip, st.top_current_ma, st.front_current_ma, st.light_dwell_ms = vals
                 _save_state()
-                dw = int(st.light_dwell_ms or 0)
-                self.append_log(f"[Light] ip={st.light_ip} top={st.top_current_ma}mA front={st.front_current_ma}mA dwell={dw}ms")
+                self.append_log(f"[Light] ip={st.light_ip} top={st.top_current_ma}mA front={st.front_current_ma}mA dwell={st.light_dwell_ms}ms")
             except Exception:
                 pass
-        self.edit_light_ip.textChanged.connect(lambda: _persist_light())
-        self.spin_top_ma.valueChanged.connect(lambda _v: _persist_light())
-        self.spin_front_ma.valueChanged.connect(lambda _v: _persist_light())
-        self.spin_dwell.valueChanged.connect(lambda _v: _persist_light())
-        self.edit_part_id.textChanged.connect(self._persist_part_id)
+        # Typing and spinning restart a short countdown; state is written once the edits settle
+        self._light_save_timer = QTimer(self)
+        self._light_save_timer.setSingleShot(True)
+        self._light_save_timer.setInterval(300)
+        self._persist_light = _persist_light
+        self._light_save_timer.timeout.connect(_persist_light)
+        self._part_id_save_timer = QTimer(self)
+        self._part_id_save_timer.setSingleShot(True)
+        self._part_id_save_timer.setInterval(300)
+        self._part_id_save_timer.timeout.connect(self._persist_part_id)
+        # Not connected to QTimer.start itself: an int argument would select start(msec) and reset the interval
+        self.edit_light_ip.textChanged.connect(self._schedule_light_save)
+        self.spin_top_ma.valueChanged.connect(self._schedule_light_save)
+        self.spin_front_ma.valueChanged.connect(self._schedule_light_save)
+        self.spin_dwell.valueChanged.connect(self._schedule_light_save)
+        self.edit_part_id.textChanged.connect(self._schedule_part_id_save)
 
         # Front Inspections gallery placeholder
         self.group_gallery = QGroupBox("Front Inspections")
@@ -242,25 +328,29 @@ class WorkflowTab(QWidget):
         log_layout = QVBoxLayout(self.group_log)
         self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(5000)
+        # Lines are buffered and appended together at most every 50 ms. append_log is also
+        # called from worker threads, so the timer is started through a queued signal.
+        self._log_buffer = []
+        self._log_lock = threading.Lock()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_flush_requested.connect(self._start_log_timer)
         log_layout.addWidget(self.log_text)
         layout.addWidget(self.group_log)
 
         # Detection Results
         self.group_results = QGroupBox("Detection Results")
         res_layout = QVBoxLayout(self.group_results)
-        self.results_table = QTableWidget(0, 7)
-        self.results_table.setHorizontalHeaderLabels([
-            "#",
-            "Class",
-            "Score",
-            "Angle (deg)",
-            "Phi (rad)",
-            "Center (x,y)",
-            "Bounds (x,y,w,h)",
-        ])
-        self.results_table.setEditTriggers(self.results_table.NoEditTriggers)
-        self.results_table.setSelectionBehavior(self.results_table.SelectRows)
-        self.results_table.setSelectionMode(self.results_table.SingleSelection)
+        # View over a model of the detection dicts; cells are formatted only when painted
+        self._results_model = _DetectionResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self._results_model)
+        self.results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.results_table.setSelectionMode(QAbstractItemView.SingleSelection)
         res_layout.addWidget(self.results_table)
         layout.addWidget(self.group_results)
 
@@ -278,35 +368,38 @@ class WorkflowTab(QWidget):
     def set_defect_loaded(self, loaded: bool):
         self._apply_primary_style(self.bt_defect_load, active=loaded)
 
+    def set_detection_enabled(self, enabled: bool):
+        self.bt_detect.setEnabled(bool(enabled))
+        self.lbl_detect_banner.setVisible(not enabled)
+
     def _apply_primary_style(self, btn: QPushButton, active: bool):
-        if active:
-            btn.setStyleSheet(
-                "QPushButton {"
-                " background-color: #2e7d32; color: white;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: #388e3c; }"
-            )
-        else:
-            btn.setStyleSheet(
-                "QPushButton {"
-                " background: transparent; color: #2e7d32;"
-                " border: 2px solid #2e7d32; padding: 6px 10px; font-weight: 600;"
-                "}"
-                "QPushButton:hover { background-color: rgba(46,125,50,0.08); }"
-            )
+        set_button_state(btn, "active" if active else "idle")
 
     # Prefill file paths from saved state
     def set_selected_files(self, attachment: str = None, front: str = None, defect: str = None):
         if attachment:
-            self.edit_attach.setPlainText(attachment)
+            self.edit_attach.setText(attachment)
         if front:
-            self.edit_front.setPlainText(front)
+            self.edit_front.setText(front)
         if defect:
-            self.edit_defect.setPlainText(defect)
+            self.edit_defect.setText(defect)
 
     def append_log(self, text: str):
-        self.log_text.appendPlainText(text)
+        with self._log_lock:
+            first = not self._log_buffer
+            self._log_buffer.append(str(text))
+        if first:
+            self._log_flush_requested.emit()
+
+    def _start_log_timer(self):
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        with self._log_lock:
+            lines, self._log_buffer = self._log_buffer, []
+        if lines:
+            self.log_text.appendPlainText("\n".join(lines))
 
     def populate_detection_results(self, detections):
         # detections is expected to be a list of dicts
@@ -315,24 +408,7 @@ class WorkflowTab(QWidget):
             rows = sorted(detections or [], key=lambda d: int(d.get("index", 0)) or 0)
         except Exception:
             rows = list(detections or [])
-        self.results_table.setRowCount(0)
-        for det in rows:
-            idx_val = det.get("index")
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            # Prefer bbox center if available; fallback to image center
-            ctr = det.get("det_center", det.get("center", ""))
-            values = [
-                str(idx_val if idx_val is not None else ""),
-                str(det.get("class", "")),
-                f"{det.get('score', '')}",
-                f"{det.get('angle', '')}",
-                (f"{det.get('phi', 0.0):.3f}" if isinstance(det.get('phi', None), (int, float)) else ""),
-                str(ctr),
-                str(det.get("bounds", "")),
-            ]
-            for col, val in enumerate(values):
-                self.results_table.setItem(row, col, QTableWidgetItem(val))
+        self._results_model.set_detections(rows)
 
     # (no backend switching)
 
@@ -342,10 +418,36 @@ class WorkflowTab(QWidget):
         except Exception:
             return ""
 
+    def _on_attach_load(self):
+        self.load_attachment_requested.emit(self.edit_attach.text().strip())
+
+    def _on_front_load(self):
+        self.load_front_requested.emit(self.edit_front.text().strip())
+
+    def _on_defect_load(self):
+        self.load_defect_requested.emit(self.edit_defect.text().strip())
+
+    def _schedule_light_save(self, _value=None):
+        self._light_save_timer.start()
+
+    def _schedule_part_id_save(self, _text=None):
+        self._part_id_save_timer.start()
+
+    def flush_pending_saves(self):
+        # Write any debounced edits that have not been saved yet (e.g. on close)
+        for timer, persist in ((self._light_save_timer, self._persist_light),
+                               (self._part_id_save_timer, self._persist_part_id)):
+            if timer.isActive():
+                timer.stop()
+                persist()
+
     def _persist_part_id(self):
         try:
             st = _state()
-            st.part_id = self.edit_part_id.text().strip()
+            part_id = self.edit_part_id.text().strip()
+            if part_id == getattr(st, "part_id", None):
+                return
+            st.part_id = part_id
             _save_state()
         except Exception:
             pass